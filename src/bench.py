@@ -0,0 +1,280 @@
+import hashlib
+import json
+import math
+import os
+import platform
+import statistics
+from datetime import datetime
+
+# Pinned benchmark configurations: (algorithm, dataset, size, pivot).
+# Changing this list invalidates stored baselines, so bump BENCH_SUITE_VERSION.
+BENCH_SUITE_VERSION = 1
+
+BENCH_SUITE = [
+    ('insertion', 'random', 1000, None),
+    ('merge', 'random', 5000, None),
+    ('quicksort', 'random', 5000, 'median3'),
+    ('quicksort', 'random', 5000, 'first'),
+    ('radix', 'random', 5000, None),
+    ('insertion', 'nearly_sorted', 2000, None),
+    ('merge', 'nearly_sorted', 5000, None),
+    ('quicksort', 'nearly_sorted', 5000, 'median3'),
+    ('merge', 'reverse', 5000, None),
+    ('quicksort', 'reverse', 5000, 'median3'),
+    ('radix', 'reverse', 5000, None),
+    ('merge', 'duplicates', 20000, None),
+    ('quicksort', 'duplicates', 20000, 'median3'),
+    ('radix', 'duplicates', 20000, None),
+]
+
+BENCH_SEED = 42
+BENCH_TRIALS = 15
+BASELINE_DIR = os.path.join('results', 'baselines')
+BENCH_DIR = os.path.join('results', 'bench')
+
+
+def machine_info():
+    """
+    Collect the machine details that make timings comparable.
+
+    Returns:
+        Dictionary describing the interpreter and hardware
+    """
+    return {
+        'system': platform.system(),
+        'machine': platform.machine(),
+        'processor': platform.processor(),
+        'cpu_count': os.cpu_count(),
+        'python_implementation': platform.python_implementation(),
+        'python_version': platform.python_version(),
+    }
+
+
+def machine_fingerprint(info=None):
+    """
+    Short stable hash of machine_info(), used to key stored baselines.
+
+    Args:
+        info: Machine info dictionary (default: current machine)
+
+    Returns:
+        12 character hex string
+    """
+    if info is None:
+        info = machine_info()
+    payload = json.dumps(info, sort_keys=True).encode('utf-8')
+    return hashlib.sha256(payload).hexdigest()[:12]
+
+
+def config_key(algorithm, dataset, n, pivot):
+    """
+    Build the identifier used to match configurations between runs.
+    """
+    key = f"{algorithm}/{dataset}/{n}"
+    if pivot:
+        key += f"/{pivot}"
+    return key
+
+
+def baseline_path(fingerprint=None):
+    """
+    Path of the stored baseline for a machine fingerprint.
+    """
+    if fingerprint is None:
+        fingerprint = machine_fingerprint()
+    return os.path.join(BASELINE_DIR, f"{fingerprint}.json")
+
+
+def default_run_path(fingerprint=None):
+    """
+    Timestamped path for a benchmark run that is not saved as a baseline.
+    """
+    if fingerprint is None:
+        fingerprint = machine_fingerprint()
+    stamp = datetime.now().strftime('%Y%m%d-%H%M%S')
+    return os.path.join(BENCH_DIR, f"{fingerprint}-{stamp}.json")
+
+
+def make_run_record(results, trials, seed):
+    """
+    Wrap per-configuration results with the metadata needed by compare.
+
+    Args:
+        results: List of per-configuration result dictionaries
+        trials: Number of timed trials per configuration
+        seed: Dataset seed
+
+    Returns:
+        Dictionary ready to be written with save_run()
+    """
+    info = machine_info()
+    return {
+        'suite_version': BENCH_SUITE_VERSION,
+        'fingerprint': machine_fingerprint(info),
+        'machine': info,
+        'created': datetime.now().isoformat(timespec='seconds'),
+        'trials': trials,
+        'seed': seed,
+        'results': results,
+    }
+
+
+def save_run(record, filepath):
+    """
+    Write a benchmark run to a JSON file, creating directories as needed.
+    """
+    directory = os.path.dirname(filepath)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    with open(filepath, 'w') as f:
+        json.dump(record, f, indent=2)
+
+
+def load_run(filepath):
+    """
+    Read a benchmark run written by save_run().
+
+    Raises:
+        ValueError: If the file is not a benchmark run
+    """
+    with open(filepath, 'r') as f:
+        record = json.load(f)
+    if 'results' not in record:
+        raise ValueError(f"{filepath} is not a benchmark run")
+    return record
+
+
+def mann_whitney_u(sample_a, sample_b):
+    """
+    Two-sided Mann-Whitney U test using the normal approximation with tie
+    correction. Timing samples are rarely normal, so a rank test is used
+    instead of a t-test.
+
+    Args:
+        sample_a: First list of measurements
+        sample_b: Second list of measurements
+
+    Returns:
+        Two-sided p-value (1.0 when the test cannot be computed)
+    """
+    n1, n2 = len(sample_a), len(sample_b)
+    if n1 == 0 or n2 == 0:
+        return 1.0
+
+    combined = sorted([(v, 0) for v in sample_a] + [(v, 1) for v in sample_b])
+    n = n1 + n2
+    ranks = [0.0] * n
+    tie_term = 0
+    i = 0
+    while i < n:
+        j = i
+        while j + 1 < n and combined[j + 1][0] == combined[i][0]:
+            j += 1
+        avg_rank = (i + j) / 2 + 1
+        for t in range(i, j + 1):
+            ranks[t] = avg_rank
+        ties = j - i + 1
+        tie_term += ties ** 3 - ties
+        i = j + 1
+
+    rank_sum_a = sum(r for r, (_, group) in zip(ranks, combined) if group == 0)
+    u = rank_sum_a - n1 * (n1 + 1) / 2
+    mean_u = n1 * n2 / 2
+    var_u = n1 * n2 / 12 * ((n + 1) - tie_term / (n * (n - 1)))
+    if var_u <= 0:
+        return 1.0
+
+    # Continuity correction
+    diff = abs(u - mean_u) - 0.5
+    if diff <= 0:
+        return 1.0
+    z = diff / math.sqrt(var_u)
+    return math.erfc(z / math.sqrt(2))
+
+
+def compare_runs(old, new, threshold=0.05, alpha=0.01):
+    """
+    Compare two benchmark runs configuration by configuration.
+
+    A configuration is a regression when its median time grew by more than
+    `threshold` (fractional) and the difference is significant at `alpha`.
+
+    Args:
+        old: Baseline run record
+        new: Candidate run record
+        threshold: Minimum relative median change to report
+        alpha: Significance level for the Mann-Whitney U test
+
+    Returns:
+        List of row dictionaries, one per configuration seen in either run
+    """
+    old_results = {r['key']: r for r in old['results']}
+    new_results = {r['key']: r for r in new['results']}
+    rows = []
+
+    for key in sorted(set(old_results) | set(new_results)):
+        before = old_results.get(key)
+        after = new_results.get(key)
+        if before is None or after is None:
+            rows.append({
+                'key': key,
+                'old_ms': statistics.median(before['times_ms']) if before else None,
+                'new_ms': statistics.median(after['times_ms']) if after else None,
+                'change': None,
+                'p_value': None,
+                'status': 'added' if before is None else 'removed',
+            })
+            continue
+
+        old_median = statistics.median(before['times_ms'])
+        new_median = statistics.median(after['times_ms'])
+        change = (new_median - old_median) / old_median if old_median > 0 else 0.0
+        p_value = mann_whitney_u(before['times_ms'], after['times_ms'])
+
+        status = 'same'
+        if p_value < alpha and change > threshold:
+            status = 'regression'
+        elif p_value < alpha and change < -threshold:
+            status = 'improvement'
+
+        rows.append({
+            'key': key,
+            'old_ms': old_median,
+            'new_ms': new_median,
+            'change': change,
+            'p_value': p_value,
+            'status': status,
+        })
+
+    return rows
+
+
+def print_comparison(rows, old, new):
+    """
+    Print a comparison table produced by compare_runs().
+
+    Returns:
+        Number of regressions found
+    """
+    if old.get('fingerprint') != new.get('fingerprint'):
+        print(f"WARNING: comparing runs from different machines "
+              f"({old.get('fingerprint')} vs {new.get('fingerprint')})")
+    if old.get('suite_version') != new.get('suite_version'):
+        print(f"WARNING: benchmark suite versions differ "
+              f"({old.get('suite_version')} vs {new.get('suite_version')})")
+
+    print(f"{'configuration':36s} | {'old ms':>9s} | {'new ms':>9s} | "
+          f"{'change':>8s} | {'p':>7s} | status")
+    print("-" * 90)
+
+    regressions = 0
+    for row in rows:
+        old_ms = f"{row['old_ms']:9.3f}" if row['old_ms'] is not None else f"{'-':>9s}"
+        new_ms = f"{row['new_ms']:9.3f}" if row['new_ms'] is not None else f"{'-':>9s}"
+        change = f"{row['change'] * 100:+7.1f}%" if row['change'] is not None else f"{'-':>8s}"
+        p_value = f"{row['p_value']:7.4f}" if row['p_value'] is not None else f"{'-':>7s}"
+        print(f"{row['key']:36s} | {old_ms} | {new_ms} | {change} | {p_value} | {row['status']}")
+        if row['status'] == 'regression':
+            regressions += 1
+
+    return regressions
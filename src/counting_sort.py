@@ -0,0 +1,233 @@
+import time
+from array import array
+
+from insertion_sort import insertionSort
+from merge_sort import merge_sort
+
+# Counting and bucket sort only pay off when the value range is small
+# compared with n; wider ranges fall back to the `fallback` algorithm.
+RANGE_FACTOR = 4
+RANGE_SLACK = 1024
+
+
+def detect_range(values):
+    """
+    Finds the minimum and maximum in one pass.
+
+    Args:
+        values: Non-empty list of integers
+
+    Returns:
+        tuple: (low, high, comparisons)
+
+    Raises:
+        ValueError: If any value is not an integer
+    """
+    low = high = values[0]
+    comparisons = 0
+    for value in values:
+        if not isinstance(value, int):
+            raise ValueError("All elements must be integers")
+        comparisons += 1
+        if value < low:
+            low = value
+        else:
+            comparisons += 1
+            if value > high:
+                high = value
+    return low, high, comparisons
+
+
+def range_too_wide(low, high, n):
+    """
+    True when a count array over [low, high] would dwarf the input.
+    """
+    return high - low + 1 > RANGE_FACTOR * n + RANGE_SLACK
+
+
+def run_fallback(values, fallback, range_comparisons, name):
+    """
+    Sort with the fallback algorithm, keeping the range-detection cost and
+    the fallback's name in the metrics.
+    """
+    sorted_values, metrics = fallback(values)
+    metrics = dict(metrics)
+    metrics['comparisons'] = metrics.get('comparisons', 0) + range_comparisons
+    metrics['range_comparisons'] = range_comparisons
+    metrics['fallback'] = name
+    return sorted_values, metrics
+
+
+def counting_sort(numbers, fallback=merge_sort, timers=None, observer=None):
+    """
+    Sorts a list of integers by counting occurrences of each value.
+
+    The value range is found in one pass; counts live in a compact int64
+    array sized to the range. If the range is too wide for n (see
+    range_too_wide) the list is sorted with `fallback` instead.
+
+    Args:
+        numbers: List of integers to be sorted
+        fallback: Sorting function used for wide ranges (default: merge_sort)
+        timers: Optional PhaseTimers recording the 'range_detection',
+            'counting' and 'output' phases
+        observer: Optional SortObserver (receives the input)
+
+    Returns:
+        tuple: A tuple containing the sorted list and a metrics dictionary.
+            - sorted list (list[int])
+            - metrics (dict): Dictionary with performance metrics
+                - 'comparisons': Comparisons made, including range detection
+                - 'moves': Number of element writes
+                - 'range_comparisons': Comparisons spent detecting the range
+                - 'fallback': Name of the fallback used (only if one was)
+    """
+    if observer is not None:
+        observer.on_input(numbers)
+    if not numbers:
+        return [], {'comparisons': 0, 'moves': 0, 'range_comparisons': 0}
+
+    if timers is not None:
+        start = time.perf_counter()
+    low, high, range_comparisons = detect_range(numbers)
+    if timers is not None:
+        timers.add('range_detection', time.perf_counter() - start)
+    if range_too_wide(low, high, len(numbers)):
+        return run_fallback(numbers.copy(), fallback, range_comparisons, fallback.__name__)
+
+    if timers is not None:
+        start = time.perf_counter()
+    counts = array('q', bytes(8 * (high - low + 1)))
+    for value in numbers:
+        counts[value - low] += 1
+    if timers is not None:
+        timers.add('counting', time.perf_counter() - start)
+        start = time.perf_counter()
+
+    result = []
+    for offset, count in enumerate(counts):
+        if count:
+            result.extend([offset + low] * count)
+    if timers is not None:
+        timers.add('output', time.perf_counter() - start)
+
+    return result, {'comparisons': range_comparisons, 'moves': len(result),
+                    'range_comparisons': range_comparisons}
+
+
+def counting_sort_stable(records, key=None, fallback=merge_sort, timers=None, observer=None):
+    """
+    Stable counting sort for records with small-range integer keys: records
+    with equal keys keep their input order.
+
+    Args:
+        records: List of records (integers when key is None)
+        key: Function returning each record's integer key (default: identity)
+        fallback: Sorting function used for wide ranges (default: merge_sort,
+            applied to (key, index, record) tuples so it stays stable)
+        timers: Optional PhaseTimers recording the 'range_detection',
+            'counting' and 'output' phases
+        observer: Optional SortObserver (receives the keys)
+
+    Returns:
+        tuple: A tuple containing the sorted list and a metrics dictionary
+            (same keys as counting_sort).
+    """
+    keys = records if key is None else [key(record) for record in records]
+    if observer is not None:
+        observer.on_input(keys)
+    if not records:
+        return [], {'comparisons': 0, 'moves': 0, 'range_comparisons': 0}
+
+    if timers is not None:
+        start = time.perf_counter()
+    low, high, range_comparisons = detect_range(keys)
+    if timers is not None:
+        timers.add('range_detection', time.perf_counter() - start)
+    if range_too_wide(low, high, len(records)):
+        decorated = [(k, i, record) for i, (k, record) in enumerate(zip(keys, records))]
+        sorted_decorated, metrics = run_fallback(decorated, fallback, range_comparisons, fallback.__name__)
+        return [item[2] for item in sorted_decorated], metrics
+
+    if timers is not None:
+        start = time.perf_counter()
+    # Prefix sums turn counts into each key's first output position
+    positions = array('q', bytes(8 * (high - low + 1)))
+    for k in keys:
+        positions[k - low] += 1
+    total = 0
+    for offset, count in enumerate(positions):
+        positions[offset] = total
+        total += count
+    if timers is not None:
+        timers.add('counting', time.perf_counter() - start)
+        start = time.perf_counter()
+
+    result = [None] * len(records)
+    for k, record in zip(keys, records):
+        slot = k - low
+        result[positions[slot]] = record
+        positions[slot] += 1
+    if timers is not None:
+        timers.add('output', time.perf_counter() - start)
+
+    return result, {'comparisons': range_comparisons, 'moves': len(result),
+                    'range_comparisons': range_comparisons}
+
+
+def bucket_sort(numbers, fallback=merge_sort, timers=None, observer=None):
+    """
+    Sorts a list of integers by scattering values into min(n, range)
+    equal-width buckets and insertion sorting each bucket. Falls back to
+    `fallback` when the range is too wide for n.
+
+    Args:
+        numbers: List of integers to be sorted
+        fallback: Sorting function used for wide ranges (default: merge_sort)
+        timers: Optional PhaseTimers recording the 'range_detection',
+            'distribution' and 'collection' phases
+        observer: Optional SortObserver (receives the input)
+
+    Returns:
+        tuple: A tuple containing the sorted list and a metrics dictionary
+            (same keys as counting_sort).
+    """
+    if observer is not None:
+        observer.on_input(numbers)
+    if not numbers:
+        return [], {'comparisons': 0, 'moves': 0, 'range_comparisons': 0}
+
+    if timers is not None:
+        start = time.perf_counter()
+    low, high, range_comparisons = detect_range(numbers)
+    if timers is not None:
+        timers.add('range_detection', time.perf_counter() - start)
+    if range_too_wide(low, high, len(numbers)):
+        return run_fallback(numbers.copy(), fallback, range_comparisons, fallback.__name__)
+
+    if timers is not None:
+        start = time.perf_counter()
+    span = high - low + 1
+    bucket_count = min(len(numbers), span)
+    buckets = [[] for _ in range(bucket_count)]
+    for value in numbers:
+        buckets[(value - low) * bucket_count // span].append(value)
+    move_count = len(numbers)
+    if timers is not None:
+        timers.add('distribution', time.perf_counter() - start)
+        start = time.perf_counter()
+
+    comparison_count = range_comparisons
+    result = []
+    for bucket in buckets:
+        if len(bucket) > 1:
+            bucket, metrics = insertionSort(bucket)
+            comparison_count += metrics['comparisons']
+            move_count += metrics['moves']
+        result.extend(bucket)
+    move_count += len(result)
+    if timers is not None:
+        timers.add('collection', time.perf_counter() - start)
+
+    return result, {'comparisons': comparison_count, 'moves': move_count,
+                    'range_comparisons': range_comparisons}
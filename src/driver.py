@@ -1,45 +1,143 @@
 import argparse
+import cProfile
 import csv
+import functools
+import json
 import random
 import time
 import os
-
+import sys
+
+import bench
+import experiments
+import profiling
+import report
+from instrumentation import PhaseTimers, StructureRecorder
+from counting_sort import bucket_sort, counting_sort, counting_sort_stable
 from insertion_sort import insertionSort
 from merge_sort import merge_sort
+from parallel_sort import DEFAULT_THREADS, effective_threads, gil_enabled, parallel_merge_sort, parallel_quick_sort
 from quicksort import quickSort
 from radix_sort import radix_sort
+from selection import nth_element, partial_sort, select, stream_top_k, top_k
 
 ALGORITHMS = {
     'insertion': insertionSort,
     'merge': merge_sort,
     'quicksort': quickSort,
     'radix': radix_sort,
+    'counting': counting_sort,
+    'counting_stable': counting_sort_stable,
+    'bucket': bucket_sort,
+}
+
+
+def sort_then_slice(a, k, pivot='median3'):
+    """
+    Baseline for the selection algorithms: full quickSort, then slice the
+    k largest values (largest first).
+    """
+    sorted_list, metrics = quickSort(a, pivot=pivot)
+    return sorted_list[len(sorted_list) - k:][::-1], metrics
+
+
+# Selection algorithms benchmarked against sort_then_slice. Each entry maps a
+# name to (run(data, k, pivot) -> (result, metrics), check(result, data, k)).
+# `k` counts from the top: select/nth_element target the k-th largest value.
+SELECTION_ALGORITHMS = {
+    'select': (
+        lambda data, k, pivot: select(data, len(data) - k, pivot),
+        lambda result, data, k: result == sorted(data)[len(data) - k],
+    ),
+    'nth_element': (
+        lambda data, k, pivot: nth_element(data, len(data) - k, pivot),
+        lambda result, data, k: result[len(data) - k] == sorted(data)[len(data) - k],
+    ),
+    'partial_sort': (
+        lambda data, k, pivot: partial_sort(data, k, pivot, largest=True),
+        lambda result, data, k: result[len(data) - k:] == sorted(data)[len(data) - k:],
+    ),
+    'top_k': (
+        top_k,
+        lambda result, data, k: result == sorted(data, reverse=True)[:k],
+    ),
+    'stream_top_k': (
+        lambda data, k, pivot: stream_top_k(iter(data), k),
+        lambda result, data, k: result == sorted(data, reverse=True)[:k],
+    ),
+    'sort_slice': (
+        sort_then_slice,
+        lambda result, data, k: result == sorted(data, reverse=True)[:k],
+    ),
 }
 
+DEFAULT_SELECTION_K = 100
+
 DEFAULT_TEST_MATRIX = [
     ('random', 1000, ['insertion', 'merge', 'quicksort', 'radix']),
     ('nearly_sorted', 5000, ['insertion', 'merge', 'quicksort']),
     ('reverse', 1000, ['insertion', 'merge', 'quicksort', 'radix']),
-    ('duplicates', 20000, ['insertion', 'merge', 'quicksort', 'radix']),
+    ('duplicates', 20000, ['insertion', 'merge', 'quicksort', 'radix', 'counting', 'bucket']),
+    ('ids', 5000, ['merge', 'quicksort', 'radix']),
+    ('paths', 5000, ['merge', 'quicksort', 'radix']),
 ]
 
+# Algorithms that accept `timers` (per-phase timing) and `observer`
+# (structural telemetry) arguments
+INSTRUMENTED_ALGORITHMS = {'merge', 'quicksort', 'radix', 'counting', 'counting_stable', 'bucket'}
+
 PIVOT_STRATEGIES = [
     'median3',
     'first',
 ]
 
+# Algorithms whose results depend on the pivot strategy
+PIVOT_ALGORITHMS = {'quicksort', 'select', 'nth_element', 'partial_sort', 'top_k', 'sort_slice'}
+
+# Execution engines an experiment can sweep
+ENGINES = [
+    'serial',
+    'threads',
+]
+
+# Thread-pool versions of algorithms for the 'threads' engine; other
+# algorithms always run serially
+PARALLEL_ALGORITHMS = {
+    'merge': parallel_merge_sort,
+    'quicksort': parallel_quick_sort,
+}
+
+# Parameters an experiment spec may sweep under "params"
+SPEC_PARAMS = {'k', 'threads'}
+
+CSV_COLUMNS = ['algorithm', 'dataset', 'n', 'comparisons', 'swaps_or_moves', 'ms', 'trial',
+               'pivot', 'engine', 'params', 'seed', 'threads', 'gil']
+
+# --profile phase timings, one row per phase per pass, in <out>.phases.csv
+PHASE_COLUMNS = ['algorithm', 'dataset', 'n', 'pivot', 'engine', 'params', 'seed', 'threads', 'gil',
+                 'pass', 'phase', 'ms']
+
+# Key datasets for comparing msd radix sort (via 'radix') with merge/quicksort
+STRING_DATASETS = ['strings', 'ids', 'paths', 'hostnames', 'bytes']
+
+LOWERCASE = 'abcdefghijklmnopqrstuvwxyz'
+PATH_PARTS = ['var', 'log', 'srv', 'data', 'home', 'app', 'cache', 'tmp', 'shared', 'releases', '2024', '2025']
+HOST_ROLES = ['web', 'api', 'db', 'cache', 'worker', 'batch']
+HOST_REGIONS = ['us-east-1', 'us-west-2', 'eu-west-1', 'ap-south-1']
+
 
 def generate_dataset(dataset_type, size, seed=None):
     """
     Generate dataset based on type and size.
     
     Args:
-        dataset_type: Type of dataset ('random', 'reverse', 'duplicates')
+        dataset_type: Type of dataset ('random', 'reverse', 'duplicates',
+            'nearly_sorted', or one of STRING_DATASETS)
         size: Number of elements
         seed: Random seed for reproducibility
         
     Returns:
-        List of integers
+        List of integers (str or bytes keys for STRING_DATASETS)
     """
     if seed is not None:
         random.seed(seed)
@@ -63,42 +161,132 @@ def generate_dataset(dataset_type, size, seed=None):
             arr[i], arr[j] = arr[j], arr[i]
         return arr
     
+    elif dataset_type == 'strings':
+        return [''.join(random.choice(LOWERCASE) for _ in range(random.randint(1, 12)))
+                for _ in range(size)]
+    
+    elif dataset_type == 'ids':
+        # Fixed-width IDs sharing a long prefix, like database keys
+        return [f"user-{random.randint(0, 10 ** 6 - 1):06d}-{random.getrandbits(32):08x}"
+                for _ in range(size)]
+    
+    elif dataset_type == 'paths':
+        return ['/' + '/'.join(random.choice(PATH_PARTS) for _ in range(random.randint(2, 6)))
+                + f"/file{random.randint(0, 999)}.log" for _ in range(size)]
+    
+    elif dataset_type == 'hostnames':
+        return [f"{random.choice(HOST_ROLES)}-{random.randint(1, 300):03d}."
+                f"{random.choice(HOST_REGIONS)}.example.com" for _ in range(size)]
+    
+    elif dataset_type == 'bytes':
+        return [random.getrandbits(8 * length).to_bytes(length, 'big')
+                for length in (random.randint(1, 16) for _ in range(size))]
+    
     else:
         raise ValueError(f"Unknown dataset type: {dataset_type}")
 
 
-def run_sorting_algorithm(algo_name, data, pivot):
+def run_selection_algorithm(algo_name, data, pivot, k, profiler=None):
+    """
+    Run a selection algorithm and collect metrics.
+    
+    Args:
+        algo_name: Name in SELECTION_ALGORITHMS
+        data: Input list (not modified)
+        pivot: Pivot strategy for the quickselect phase
+        k: Number of top elements (clipped to len(data))
+        profiler: Optional cProfile.Profile, enabled only around the run
+        
+    Returns:
+        Tuple of (time_ms, metrics_dict)
+    """
+    if pivot not in PIVOT_STRATEGIES:
+        raise ValueError(f"Invalid pivot strategy: {pivot}")
+    run, check = SELECTION_ALGORITHMS[algo_name]
+    k = min(k, len(data))
+    
+    start_time = time.perf_counter()
+    if profiler is None:
+        result, metrics = run(data, k, pivot)
+    else:
+        result, metrics = profiler.runcall(run, data, k, pivot)
+    end_time = time.perf_counter()
+    
+    time_ms = (end_time - start_time) * 1000
+    
+    if k > 0 and not check(result, data, k):
+        print(f"WARNING: {algo_name} did not select correctly!")
+    
+    return time_ms, metrics
+
+
+def run_sorting_algorithm(algo_name, data, pivot, timers=None, observer=None, k=DEFAULT_SELECTION_K,
+                          engine='serial', threads=1, profiler=None):
     """
     Run a sorting algorithm and collect metrics.
     
     Args:
         algo_name: Name of the algorithm
         data: List to sort (will be copied to preserve original)
+        pivot: Pivot strategy for quicksort
+        timers: Optional PhaseTimers; phase totals are added to the metrics
+            (serial engine only)
+        observer: Optional SortObserver passed through to the algorithm
+            (serial engine only)
+        k: Number of top elements for selection algorithms
+        engine: 'serial', or 'threads' for an algorithm in PARALLEL_ALGORITHMS
+        threads: Worker threads for the 'threads' engine
+        profiler: Optional cProfile.Profile, enabled only around the
+            algorithm call
         
     Returns:
         Tuple of (time_ms, metrics_dict)
     """
+    if algo_name in SELECTION_ALGORITHMS:
+        return run_selection_algorithm(algo_name, data, pivot, k, profiler)
     if algo_name not in ALGORITHMS:
         raise ValueError(f"Unknown algorithm: {algo_name}")
     
     algo_func = ALGORITHMS[algo_name]
+    kwargs = {}
+    if algo_name == 'quicksort':
+        if pivot not in PIVOT_STRATEGIES:
+            raise ValueError(f"Invalid pivot strategy: {pivot}")
+        kwargs['pivot'] = pivot
+    if engine == 'threads':
+        if algo_name not in PARALLEL_ALGORITHMS:
+            raise ValueError(f"Engine 'threads' does not support {algo_name}")
+        # Timers and observers are not thread-safe, so they are not passed
+        algo_func = PARALLEL_ALGORITHMS[algo_name]
+        kwargs['threads'] = threads
+    elif engine != 'serial':
+        raise ValueError(f"Unknown engine: {engine}")
+    else:
+        if timers is not None and algo_name in INSTRUMENTED_ALGORITHMS:
+            timers.reset()
+            kwargs['timers'] = timers
+        if observer is not None and algo_name in INSTRUMENTED_ALGORITHMS:
+            kwargs['observer'] = observer
     
     # Make a copy to avoid modifying original data
     data_copy = data.copy()
     
     # Time the sorting
     start_time = time.perf_counter()
-    if algo_name == 'quicksort':
-        if pivot not in PIVOT_STRATEGIES:
-            raise ValueError(f"Invalid pivot strategy: {pivot}")
-        sorted_data, metrics = algo_func(data_copy, pivot=pivot)
-    else: 
-        sorted_data, metrics = algo_func(data_copy)
+    if profiler is None:
+        sorted_data, metrics = algo_func(data_copy, **kwargs)
+    else:
+        sorted_data, metrics = profiler.runcall(algo_func, data_copy, **kwargs)
     end_time = time.perf_counter()
     
     # Convert to milliseconds
     time_ms = (end_time - start_time) * 1000
     
+    if timers is not None:
+        # Copy so phase entries never leak into a shared metrics dict
+        metrics = dict(metrics)
+        metrics.update(timers.as_metrics())
+    
     # Verify sorting correctness
     expected = sorted(data)
     if sorted_data != expected:
@@ -151,38 +339,57 @@ def build_test_matrix(args):
     return result
 
 
-def write_csv_header(filepath):
+def write_csv_header(filepath, columns=CSV_COLUMNS):
     """
     Write CSV header if file doesn't exist.
     
     Args:
         filepath: Path to CSV file
+        columns: Column layout of the file
+        
+    Raises:
+        ValueError: If the file exists with a different column layout
     """
-    if not os.path.exists(filepath):
+    if not os.path.exists(filepath) or os.path.getsize(filepath) == 0:
         with open(filepath, 'w', newline='') as f:
             writer = csv.writer(f)
-            writer.writerow(['algorithm', 'dataset', 'n', 'comparisons', 'swaps_or_moves', 'ms', 'trial'])
+            writer.writerow(columns)
+        return
+    
+    with open(filepath, 'r', newline='') as f:
+        reader = csv.reader(f)
+        header = next(reader, [])
+        has_rows = next(reader, None) is not None
+    if header != columns:
+        if has_rows:
+            if columns is not CSV_COLUMNS:
+                raise ValueError(f"{filepath} uses a different column layout; move it aside or choose another --out")
+            raise ValueError(f"{filepath} uses an older column layout; convert it with "
+                             f"'driver.py merge-results NEW.csv {filepath}' or choose another --out")
+        # A header-only file from an older layout can simply be rewritten
+        with open(filepath, 'w', newline='') as f:
+            csv.writer(f).writerow(columns)
 
 
-def append_csv_row(filepath, row_data):
+def append_csv_row(filepath, row_data, columns=CSV_COLUMNS):
     """
     Append a row to the CSV file.
     
     Args:
         filepath: Path to CSV file
-        row_data: Dictionary with keys matching CSV columns
+        row_data: Dictionary with keys matching the columns
+        columns: Column layout of the file
     """
     with open(filepath, 'a', newline='') as f:
         writer = csv.writer(f)
-        writer.writerow([
-            row_data['algorithm'],
-            row_data['dataset'],
-            row_data['n'],
-            row_data['comparisons'],
-            row_data['swaps_or_moves'],
-            row_data['ms'],
-            row_data['trial']
-        ])
+        writer.writerow([row_data[column] for column in columns])
+
+
+def phases_path(results_file):
+    """
+    Sidecar file for --profile phase timings: runs.csv -> runs.phases.csv.
+    """
+    return os.path.splitext(results_file)[0] + '.phases.csv'
 
 
 def is_non_decreasing(lst):
@@ -341,8 +548,14 @@ def run_sanity_checks(pivot='median3', seed=42):
 
     all_algorithms_passed = True
 
-    for algo_name, algo_func in ALGORITHMS.items():
-        print(f"\nTesting {algo_name.upper()}:")
+    # Thread-pool variants run with a tiny cutoff so small inputs still fork
+    # (they sort serially while the GIL is enabled)
+    candidates = [(algo_name, algo_name, algo_func) for algo_name, algo_func in ALGORITHMS.items()]
+    candidates += [(f"{algo_name} (threads)", algo_name, functools.partial(algo_func, threads=2, cutoff=2))
+                   for algo_name, algo_func in PARALLEL_ALGORITHMS.items()]
+
+    for label, algo_name, algo_func in candidates:
+        print(f"\nTesting {label.upper()}:")
         print("-" * 40)
 
         # Run basic sanity tests
@@ -352,9 +565,9 @@ def run_sanity_checks(pivot='median3', seed=42):
         smoke_passed = run_smoke_tests(algo_name, algo_func, pivot, seed)
 
         if basic_passed and smoke_passed:
-            print(f"✓ {algo_name.upper()} passed all sanity checks")
+            print(f"✓ {label.upper()} passed all sanity checks")
         else:
-            print(f"✗ {algo_name.upper()} FAILED sanity checks")
+            print(f"✗ {label.upper()} FAILED sanity checks")
             all_algorithms_passed = False
 
     print("\n" + "=" * 60)
@@ -367,23 +580,271 @@ def run_sanity_checks(pivot='median3', seed=42):
     return all_algorithms_passed
 
 
+def run_bench_suite(trials=bench.BENCH_TRIALS, seed=bench.BENCH_SEED, warmup=True):
+    """
+    Run the pinned benchmark suite and collect raw trial timings.
+
+    Args:
+        trials: Number of timed trials per configuration
+        seed: Random seed for dataset generation
+        warmup: Run one discarded trial before timing each configuration
+
+    Returns:
+        List of per-configuration result dictionaries
+    """
+    results = []
+    for algo, dataset_type, size, pivot in bench.BENCH_SUITE:
+        key = bench.config_key(algo, dataset_type, size, pivot)
+        data = generate_dataset(dataset_type, size, seed)
+        if warmup:
+            run_sorting_algorithm(algo, data, pivot=pivot)
+
+        times = []
+        metrics = {}
+        for _ in range(trials):
+            time_ms, metrics = run_sorting_algorithm(algo, data, pivot=pivot)
+            times.append(time_ms)
+
+        results.append({
+            'key': key,
+            'algorithm': algo,
+            'dataset': dataset_type,
+            'n': size,
+            'pivot': pivot,
+            'times_ms': [round(t, 4) for t in times],
+            'comparisons': metrics.get('comparisons', 0),
+            'swaps_or_moves': metrics.get('swaps', 0) or metrics.get('moves', 0),
+        })
+        print(f"  {key:36s} median {sorted(times)[len(times) // 2]:9.3f} ms")
+    return results
+
+
+def bench_command(argv):
+    """
+    `driver.py bench`: run the pinned suite and store the result.
+
+    Returns:
+        Process exit code
+    """
+    parser = argparse.ArgumentParser(prog='driver.py bench', description='Run the pinned benchmark suite')
+    parser.add_argument('--trials', type=int, default=bench.BENCH_TRIALS,
+                        help=f'Trials per configuration (default: {bench.BENCH_TRIALS})')
+    parser.add_argument('--out', type=str, help='Output JSON path (default: results/bench/<fingerprint>-<time>.json)')
+    parser.add_argument('--save-baseline', action='store_true',
+                        help='Store the run as the baseline for this machine')
+    parser.add_argument('--check', action='store_true',
+                        help='Compare against the stored baseline for this machine and fail on regression')
+    parser.add_argument('--threshold', type=float, default=0.05,
+                        help='Relative slowdown treated as a regression (default: 0.05)')
+    parser.add_argument('--alpha', type=float, default=0.01, help='Significance level (default: 0.01)')
+    args = parser.parse_args(argv)
+
+    fingerprint = bench.machine_fingerprint()
+    baseline_file = bench.baseline_path(fingerprint)
+    # Load the baseline before anything is saved, so --save-baseline --check
+    # compares against the previous baseline rather than this run
+    baseline = None
+    if args.check:
+        if not os.path.exists(baseline_file):
+            print(f"No baseline for this machine at {baseline_file}; run with --save-baseline first.")
+            return 2
+        baseline = bench.load_run(baseline_file)
+
+    print("=" * 60)
+    print("BENCHMARK SUITE")
+    print("=" * 60)
+    print(f"Machine fingerprint: {fingerprint}")
+    print(f"Trials per configuration: {args.trials}\n")
+
+    record = bench.make_run_record(run_bench_suite(trials=args.trials), args.trials, bench.BENCH_SEED)
+
+    regressions = 0
+    if baseline is not None:
+        print(f"\nComparing against baseline {baseline_file}\n")
+        rows = bench.compare_runs(baseline, record, args.threshold, args.alpha)
+        regressions = bench.print_comparison(rows, baseline, record)
+
+    out = args.out
+    if out is None:
+        out = bench.default_run_path(fingerprint)
+    bench.save_run(record, out)
+    print(f"\nResults written to: {out}")
+    if args.save_baseline:
+        if regressions:
+            # Never roll a regressed run forward as the new baseline
+            print(f"Baseline not updated: {regressions} regression(s)")
+        else:
+            bench.save_run(record, baseline_file)
+            print(f"Baseline written to: {baseline_file}")
+    return 1 if regressions else 0
+
+
+def compare_command(argv):
+    """
+    `driver.py compare old new`: diff two benchmark runs.
+
+    Returns:
+        1 if any configuration regressed beyond the threshold, else 0
+    """
+    parser = argparse.ArgumentParser(prog='driver.py compare', description='Compare two benchmark runs')
+    parser.add_argument('old', help='Baseline run JSON')
+    parser.add_argument('new', help='Candidate run JSON')
+    parser.add_argument('--threshold', type=float, default=0.05,
+                        help='Relative slowdown treated as a regression (default: 0.05)')
+    parser.add_argument('--alpha', type=float, default=0.01, help='Significance level (default: 0.01)')
+    args = parser.parse_args(argv)
+
+    try:
+        old = bench.load_run(args.old)
+        new = bench.load_run(args.new)
+    except (OSError, ValueError) as e:
+        print(f"Error loading benchmark runs: {e}")
+        return 2
+
+    rows = bench.compare_runs(old, new, args.threshold, args.alpha)
+    regressions = bench.print_comparison(rows, old, new)
+    print(f"\n{regressions} regression(s) beyond {args.threshold * 100:.1f}% at alpha={args.alpha}")
+    return 1 if regressions else 0
+
+
+def report_command(argv):
+    """
+    `driver.py report`: stream a results CSV into a grouped summary table.
+
+    Returns:
+        Process exit code
+    """
+    parser = argparse.ArgumentParser(prog='driver.py report',
+                                     description='Summarize a results CSV with streaming statistics')
+    parser.add_argument('csv_file', nargs='?', default='results/runs.csv',
+                        help='Results CSV (default: results/runs.csv)')
+    parser.add_argument('--group-by', type=str, default='algorithm,dataset,n',
+                        help='Comma-separated columns to group by (default: algorithm,dataset,n)')
+    parser.add_argument('--value', type=str, default='ms', help='Numeric column to summarize (default: ms)')
+    parser.add_argument('--out', type=str, help='Also write the summary table to this CSV file')
+    parser.add_argument('--no-cache', action='store_true', help='Ignore and do not update the summary cache')
+    args = parser.parse_args(argv)
+
+    if not os.path.exists(args.csv_file):
+        print(f"Results file not found: {args.csv_file}")
+        return 2
+    group_by = [c for c in args.group_by.split(',') if c]
+
+    try:
+        summary, cached = report.load_summary(args.csv_file, group_by, args.value, use_cache=not args.no_cache)
+    except ValueError as e:
+        print(f"Error: {e}")
+        return 2
+
+    print(f"Summary of {args.csv_file}" + (" (cached)" if cached else ""))
+    print()
+    report.print_report(summary, group_by, args.value)
+    if args.out:
+        report.write_summary(summary, group_by, args.out)
+        print(f"Summary written to: {args.out}")
+    return 0
+
+
+def merge_results_command(argv):
+    """
+    `driver.py merge-results OUT IN...`: combine per-shard CSVs.
+
+    Returns:
+        Process exit code
+    """
+    parser = argparse.ArgumentParser(prog='driver.py merge-results',
+                                     description='Merge and de-duplicate result CSVs from several shards')
+    parser.add_argument('out', help='Merged output CSV')
+    parser.add_argument('inputs', nargs='+', help='Result CSVs to merge (earlier files win on duplicates)')
+    args = parser.parse_args(argv)
+
+    if os.path.abspath(args.out) in [os.path.abspath(path) for path in args.inputs]:
+        print("Error: the output file must not be one of the inputs")
+        return 2
+    missing = [path for path in args.inputs if not os.path.exists(path)]
+    if missing:
+        print(f"Error: input file(s) not found: {', '.join(missing)}")
+        return 2
+
+    written, duplicates = experiments.merge_result_files(args.out, args.inputs, CSV_COLUMNS)
+    print(f"Merged {len(args.inputs)} file(s) into {args.out}: "
+          f"{written} rows, {duplicates} duplicate rows dropped")
+    return 0
+
+
+COMMANDS = {
+    'bench': bench_command,
+    'compare': compare_command,
+    'report': report_command,
+    'merge-results': merge_results_command,
+}
+
+
 def main():
     """
     Main driver function for running sorting experiments.
     """
+    # Subcommands take over the whole command line
+    if len(sys.argv) > 1 and sys.argv[1] in COMMANDS:
+        sys.exit(COMMANDS[sys.argv[1]](sys.argv[2:]))
+
     # Parse command line arguments
     parser = argparse.ArgumentParser(description='Run sorting algorithm experiments')
     parser.add_argument('--algos', type=str, help='Comma-separated list of algorithms to run (default: all)')
     parser.add_argument('--pivot', type=str, default='median3', help='Pivot strategy for quicksort (default: median3)')
+    parser.add_argument('--engine', type=str, default=ENGINES[0], choices=ENGINES,
+                        help='Execution engine for merge and quicksort (default: serial)')
+    parser.add_argument('--threads', type=int, default=DEFAULT_THREADS,
+                        help=f'Worker threads for the threads engine (default: {DEFAULT_THREADS})')
     parser.add_argument('--datasets', type=str, help='Comma-separated list of datasets (default: all from matrix)')
     parser.add_argument('--sizes', type=str, help='Comma-separated list of sizes (default: from test matrix)')
     parser.add_argument('--trials', type=int, default=5, help='Number of trials per configuration (default: 5)')
     parser.add_argument('--seed', type=int, default=42, help='Random seed for dataset generation (default: 42)')
-    parser.add_argument('--out', type=str, default='results/runs.csv', help='Output CSV file path')
+    parser.add_argument('--out', type=str,
+                        help='Output CSV file path (default: results/runs.csv, or results/runs.shard-I-of-N.csv)')
     parser.add_argument('--warmup', action='store_true', help='Run warmup trial before measurements')
     parser.add_argument('--skip-sanity', action='store_true', help='Skip sanity checks before running experiments')
+    parser.add_argument('--profile', action='store_true',
+                        help='Run each configuration under cProfile and record per-phase timers')
+    parser.add_argument('--telemetry', action='store_true',
+                        help='Record recursion depth, split/merge/run-length histograms and bucket occupancy')
+    parser.add_argument('--k', type=int, default=DEFAULT_SELECTION_K,
+                        help=f'Number of top elements for selection algorithms (default: {DEFAULT_SELECTION_K})')
+    parser.add_argument('--profile-dir', type=str, default='results/profiles',
+                        help='Directory for .prof and .collapsed output (default: results/profiles)')
+    parser.add_argument('--spec', type=str,
+                        help='JSON experiment spec (replaces --algos/--datasets/--sizes/--pivot/--k)')
+    parser.add_argument('--shard', type=str, help='Run only shard i of N of the matrix, e.g. --shard 2/4')
+    parser.add_argument('--plan', action='store_true', help='Print the shard assignment and exit')
 
     args = parser.parse_args()
+    if args.k < 1:
+        parser.error("--k must be at least 1")
+    if args.threads < 1:
+        parser.error("--threads must be at least 1")
+
+    # Build the list of configurations from a spec or from the test matrix
+    try:
+        if args.spec:
+            spec = experiments.load_spec(args.spec)
+            args.trials = spec.get('trials', args.trials)
+            args.seed = spec.get('seed', args.seed)
+            args.warmup = spec.get('warmup', args.warmup)
+            configs = configs_from_spec(spec)
+        else:
+            configs = configs_from_matrix(build_test_matrix(args), args)
+        shard_index, shard_count = experiments.parse_shard(args.shard) if args.shard else (1, 1)
+    except (OSError, ValueError) as e:
+        print(f"Error building test matrix: {e}")
+        return
+
+    if args.plan:
+        print_plan(configs, shard_count)
+        return
+    if shard_count > 1:
+        configs = experiments.shard_configs(configs, shard_index, shard_count)
+    if args.out is None:
+        args.out = 'results/runs.csv' if shard_count == 1 else f'results/runs.shard-{shard_index}-of-{shard_count}.csv'
 
     # Run sanity checks unless skipped
     if not args.skip_sanity:
@@ -394,43 +855,58 @@ def main():
 
     # Create results directory and results csv if they don't exist
     os.makedirs(os.path.dirname(args.out) if os.path.dirname(args.out) else '.', exist_ok=True)
-    write_csv_header(args.out)
-
-    # Build test matrix according to provided arguments
     try:
-        test_matrix = build_test_matrix(args)
+        write_csv_header(args.out)
+        if args.profile:
+            write_csv_header(phases_path(args.out), PHASE_COLUMNS)
     except ValueError as e:
-        print(f"Error building test matrix: {e}")
+        print(f"Error: {e}")
         return
 
     print("=" * 60)
     print("SORTING ALGORITHM EXPERIMENTS")
     print("=" * 60)
     print(f"Output file: {args.out}")
+    if args.spec:
+        print(f"Experiment spec: {args.spec}")
+    if shard_count > 1:
+        print(f"Shard: {shard_index}/{shard_count} ({len(configs)} configurations)")
     print(f"Trials per configuration: {args.trials}")
     print(f"Random seed: {args.seed}")
     print(f"Warmup enabled: {args.warmup}")
+    print(f"Profiling enabled: {args.profile}")
+    print(f"Telemetry enabled: {args.telemetry}")
+    print(f"GIL enabled: {gil_enabled()}")
     
-    # Run experiments based on test matrix
-    for dataset_type, size, matrix_algos in test_matrix:
+    # Run experiments, generating each dataset once for all of its configurations
+    for (dataset_type, size), dataset_configs in group_by_dataset(configs):
         print(f"\nDataset: {dataset_type}, Size: {size}")
         print("-" * 40)
         
-        # Generate dataset once for all algorithms
         try:
             data = generate_dataset(dataset_type, size, args.seed)
-        except NotImplementedError as e:
+        except (NotImplementedError, ValueError) as e:
             print(f"  Skipping: {e}")
             continue
         
-        # Run each algorithm
-        for algo in matrix_algos:
-            print(f"  Running {algo}...")
+        # Run each configuration
+        for config in dataset_configs:
+            algo = config['algorithm']
+            pivot = config['pivot'] or args.pivot
+            k = config['params'].get('k', args.k)
+            engine = config['engine']
+            threads = 1
+            if engine == 'threads':
+                threads = effective_threads(config['params'].get('threads', args.threads))
+            details = config_details(config)
+            print(f"  Running {algo}" + (f" ({details})" if details else "") + "...")
+            if engine == 'threads' and threads == 1:
+                print("    GIL enabled or 1 thread: running serially")
             
             # Warmup run if requested
             if args.warmup:
                 try:
-                    _, _ = run_sorting_algorithm(algo, data, pivot=args.pivot)
+                    _, _ = run_sorting_algorithm(algo, data, pivot=pivot, k=k, engine=engine, threads=threads)
                     print(f"    Warmup complete")
                 except Exception as e:
                     print(f"    Warmup failed: {e}")
@@ -438,7 +914,8 @@ def main():
             # Run trials
             for trial in range(1, args.trials + 1):
                 try:
-                    time_ms, metrics = run_sorting_algorithm(algo, data, pivot=args.pivot)
+                    time_ms, metrics = run_sorting_algorithm(algo, data, pivot=pivot, k=k,
+                                                             engine=engine, threads=threads)
                     
                     row_data = {
                         'algorithm': algo,
@@ -447,26 +924,243 @@ def main():
                         'comparisons': metrics.get('comparisons', 0),
                         'swaps_or_moves': metrics.get('swaps', 0) or metrics.get('moves', 0),
                         'ms': f"{time_ms:.3f}",
-                        'trial': trial
+                        'trial': trial,
+                        'pivot': config['pivot'],
+                        'engine': config['engine'],
+                        'params': experiments.params_text(config['params']),
+                        'seed': args.seed,
+                        'threads': threads,
+                        'gil': 'on' if gil_enabled() else 'off',
                     }
                     
                     append_csv_row(args.out, row_data)
                     
                     print(f"    Trial {trial}: {time_ms:.3f} ms, "
                           f"Comparisons: {row_data.get('comparisons', 0)}, "
-                          f"Moves: {row_data.get('swaps_or_moves', 0)}")
+                          f"Moves: {row_data.get('swaps_or_moves', 0)}"
+                          + (f", Range checks: {metrics['range_comparisons']}" if 'range_comparisons' in metrics else "")
+                          + (f", Fallback: {metrics['fallback']}" if 'fallback' in metrics else ""))
                 
                 except Exception as e:
                     print(f"    Trial {trial} failed: {e}")
+            
+            # Profiled passes run after the timed trials and are never written
+            # to the CSV, since cProfile and the phase timers inflate their time
+            if args.profile:
+                try:
+                    profile_config(config, data, pivot, k, engine, threads, args)
+                except Exception as e:
+                    print(f"    Profiling failed: {e}")
+            
+            # Telemetry is deterministic for a given input, so one extra
+            # untimed observed pass is enough; it is not written to the CSV
+            if args.telemetry:
+                try:
+                    recorder = StructureRecorder()
+                    # Observers are not thread-safe, so this pass always runs
+                    # serially; the threads engine splits work the same way
+                    run_sorting_algorithm(algo, data, pivot=pivot, observer=recorder, k=k)
+                    if not recorder.runs:
+                        print(f"    Telemetry not available for {algo}")
+                    else:
+                        if engine != ENGINES[0]:
+                            print(f"    Telemetry from a serial pass (not supported by the {engine} engine)")
+                        print_telemetry(recorder.as_dict())
+                except Exception as e:
+                    print(f"    Telemetry failed: {e}")
     
     print("\n" + "=" * 60)
     print("EXPERIMENTS COMPLETE")
     print(f"Results written to: {args.out}")
+    if args.profile:
+        print(f"Phase timings written to: {phases_path(args.out)}")
     print("=" * 60)
     
     print_summary(args.out)
 
 
+def profile_config(config, data, pivot, k, engine, threads, args):
+    """
+    Profile one configuration with two kinds of extra passes, args.trials
+    of each, none of them written to the results CSV:
+    - phase timer passes, without cProfile, whose per-phase times go to
+      <out>.phases.csv and are printed as averages
+    - cProfile passes, without phase timers (their shared wrapper would hide
+      the real call stacks), written as .prof and .collapsed files
+    """
+    algo = config['algorithm']
+    timers = PhaseTimers()
+    phase_totals = {}
+    for pass_number in range(1, args.trials + 1):
+        _, metrics = run_sorting_algorithm(algo, data, pivot=pivot, timers=timers, k=k,
+                                           engine=engine, threads=threads)
+        for phase, value in metrics.items():
+            if phase.endswith('_ms'):
+                phase_totals[phase] = phase_totals.get(phase, 0.0) + value
+                append_csv_row(phases_path(args.out), {
+                    'algorithm': algo,
+                    'dataset': config['dataset'],
+                    'n': config['n'],
+                    'pivot': config['pivot'],
+                    'engine': config['engine'],
+                    'params': experiments.params_text(config['params']),
+                    'seed': args.seed,
+                    'threads': threads,
+                    'gil': 'on' if gil_enabled() else 'off',
+                    'pass': pass_number,
+                    'phase': phase[:-3],
+                    'ms': f"{value:.3f}",
+                }, PHASE_COLUMNS)
+    
+    profiler = cProfile.Profile()
+    for _ in range(args.trials):
+        run_sorting_algorithm(algo, data, pivot=pivot, k=k, engine=engine, threads=threads, profiler=profiler)
+    
+    # Every swept dimension goes into the name so configurations never
+    # overwrite each other, e.g. top_k_random_100000_pivot-median3_k-10
+    details = config_details(config).replace('=', '-').split()
+    if engine == 'threads' and 'threads' not in config['params']:
+        details.append(f"threads-{threads}")
+    name = '_'.join([algo, config['dataset'], str(config['n'])] + details)
+    prof_path, collapsed_path = profiling.write_profile(profiler, os.path.join(args.profile_dir, name))
+    print(f"    Profile: {prof_path}, {collapsed_path}")
+    for phase, total in sorted(phase_totals.items()):
+        print(f"    Phase {phase[:-3]}: {total / args.trials:.3f} ms/pass")
+
+
+def configs_from_matrix(test_matrix, args):
+    """
+    Turn (dataset, size, algos) matrix rows into configuration dictionaries
+    using the single --pivot, --engine and --k from the command line.
+    Algorithms without a parallel version keep the serial engine.
+    """
+    configs = []
+    for dataset_type, size, matrix_algos in test_matrix:
+        for algo in matrix_algos:
+            configs.append({
+                'algorithm': algo,
+                'dataset': dataset_type,
+                'n': size,
+                'pivot': args.pivot if algo in PIVOT_ALGORITHMS else '',
+                'engine': args.engine if algo in PARALLEL_ALGORITHMS else ENGINES[0],
+                'params': {'k': args.k} if algo in SELECTION_ALGORITHMS else {},
+            })
+    return configs
+
+
+def configs_from_spec(spec):
+    """
+    Expand an experiment spec and validate its names. Configurations the
+    'threads' engine cannot run (algorithms without a parallel version) run
+    serially instead, and the serial engine ignores a "threads" param;
+    configurations that become identical are kept once.
+    
+    Raises:
+        ValueError: For unknown algorithms, pivots, engines or params
+    """
+    configs = []
+    seen = set()
+    for config in experiments.expand_spec(spec, PIVOT_ALGORITHMS, PIVOT_STRATEGIES[0], ENGINES[0]):
+        if config['engine'] == 'threads' and config['algorithm'] not in PARALLEL_ALGORITHMS:
+            config['engine'] = ENGINES[0]
+        if config['engine'] != 'threads':
+            config['params'].pop('threads', None)
+        key = experiments.config_key(config)
+        if key not in seen:
+            seen.add(key)
+            configs.append(config)
+    for config in configs:
+        if config['algorithm'] not in ALGORITHMS and config['algorithm'] not in SELECTION_ALGORITHMS:
+            raise ValueError(f"Unknown algorithm: {config['algorithm']}")
+        if config['pivot'] and config['pivot'] not in PIVOT_STRATEGIES:
+            raise ValueError(f"Invalid pivot strategy: {config['pivot']}")
+        if config['engine'] not in ENGINES:
+            raise ValueError(f"Unknown engine: {config['engine']} (options: {', '.join(ENGINES)})")
+        unknown = set(config['params']) - SPEC_PARAMS
+        if unknown:
+            raise ValueError(f"Unknown param(s): {', '.join(sorted(unknown))} (options: {', '.join(sorted(SPEC_PARAMS))})")
+        threads = config['params'].get('threads', 1)
+        if not isinstance(threads, int) or threads < 1:
+            raise ValueError(f"threads must be a positive integer, got {threads!r}")
+    return configs
+
+
+def group_by_dataset(configs):
+    """
+    Group configurations by (dataset, size), keeping first-seen order, so
+    each dataset is generated once.
+    """
+    groups = {}
+    for config in configs:
+        groups.setdefault((config['dataset'], config['n']), []).append(config)
+    return list(groups.items())
+
+
+def print_plan(configs, shard_count):
+    """
+    Print the shard assignment and predicted load of every configuration.
+    """
+    assignment, loads = experiments.assign_shards(configs, shard_count)
+    total = sum(loads) or 1.0
+    for shard in range(1, shard_count + 1):
+        print(f"Shard {shard}/{shard_count}: predicted load {loads[shard - 1] / total * 100:5.1f}%")
+        for config, assigned in zip(configs, assignment):
+            if assigned == shard:
+                print(f"  {describe_config(config):60s} cost {experiments.predict_cost(config):14.0f}")
+
+
+def config_details(config):
+    """
+    Pivot, non-default engine and params of a configuration, e.g.
+    "pivot=first k=10".
+    """
+    details = []
+    if config['pivot']:
+        details.append(f"pivot={config['pivot']}")
+    if config['engine'] != ENGINES[0]:
+        details.append(f"engine={config['engine']}")
+    for name, value in sorted(config['params'].items()):
+        details.append(f"{name}={value}")
+    return ' '.join(details)
+
+
+def describe_config(config):
+    """
+    One-line label such as "quicksort random n=1000 pivot=first".
+    """
+    return f"{config['algorithm']} {config['dataset']} n={config['n']} {config_details(config)}".rstrip()
+
+
+def print_telemetry(telemetry):
+    """
+    Print one configuration's structural telemetry.
+    
+    Args:
+        telemetry: Dictionary from StructureRecorder.as_dict()
+    """
+    def format_histogram(histogram):
+        return ", ".join(f"{size}+: {count:g}" for size, count in histogram.items())
+    
+    print(f"    Max recursion depth: {telemetry['max_depth']}")
+    if any(telemetry['split_histogram']):
+        print("    Partition balance (smaller side / range, 0.00 = degenerate): "
+              + ", ".join(f"{i * 0.05:.2f}: {count:g}"
+                          for i, count in enumerate(telemetry['split_histogram']) if count))
+    if telemetry['merge_size_histogram']:
+        print(f"    Merge sizes: {format_histogram(telemetry['merge_size_histogram'])}")
+        print(f"    Merges of already-ordered halves: {telemetry['presorted_merges']:g}")
+    if telemetry['bucket_occupancy']:
+        for pass_index, occupancy in telemetry['bucket_occupancy'].items():
+            if len(occupancy) > 10:
+                # Byte-wise (msd) passes have 257 buckets; summarize them
+                used = sum(1 for c in occupancy if c)
+                print(f"    Level {pass_index} buckets: {used} non-empty, "
+                      f"largest {max(occupancy):g}, ended keys {occupancy[0]:g}")
+            else:
+                print(f"    Pass {pass_index} buckets: {' '.join(f'{c:g}' for c in occupancy)}")
+    print(f"    Input run lengths: {format_histogram(telemetry['run_length_histogram'])}")
+
+
 def print_summary(csv_file):
     """
     Print summary statistics from the results CSV.
@@ -480,21 +1174,19 @@ def print_summary(csv_file):
     print("\nSUMMARY STATISTICS")
     print("-" * 40)
     
-    # Read CSV and compute averages
-    results = {}
-    with open(csv_file, 'r') as f:
-        reader = csv.DictReader(f)
-        for row in reader:
-            key = (row['algorithm'], row['dataset'], row['n'])
-            if key not in results:
-                results[key] = []
-            results[key].append(float(row['ms']))
+    # Stream the CSV once with constant-memory statistics per configuration
+    summary = report.aggregate_csv(csv_file, ['algorithm', 'dataset', 'n', 'pivot', 'params',
+                                              'engine', 'threads'])
     
     # Print averages
-    for (algo, dataset, n), times in sorted(results.items()):
-        avg_time = sum(times) / len(times)
+    for (algo, dataset, n, pivot, params, engine, threads), row in summary:
+        if engine == 'threads':
+            algo = f"{algo} x{threads}"
+        details = config_details({'pivot': pivot, 'engine': ENGINES[0],
+                                  'params': json.loads(params) if params else {}})
         print(f"{algo:12s} | {dataset:15s} | n={n:6s} | "
-              f"Avg: {avg_time:8.3f} ms | Trials: {len(times)}")
+              f"Avg: {row['mean']:8.3f} ms | Trials: {row['count']}"
+              + (f" | {details}" if details else ""))
 
 
 if __name__ == "__main__":
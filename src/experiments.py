@@ -0,0 +1,227 @@
+import csv
+import json
+import math
+import os
+
+# Every configuration is one (algorithm, dataset, n, pivot, engine, params)
+# combination; these columns identify a measured trial in a results CSV
+# (thread count and GIL state distinguish runs on different interpreters).
+KEY_COLUMNS = ['algorithm', 'dataset', 'n', 'pivot', 'engine', 'params', 'seed', 'threads', 'gil', 'trial']
+
+SPEC_FIELDS = {'algorithms', 'datasets', 'sizes', 'pivots', 'engines', 'params'}
+
+
+def load_spec(filepath):
+    """
+    Read a JSON experiment spec.
+
+    A spec has optional run settings ("trials", "seed", "warmup") and a list
+    of "experiments". Each experiment sweeps the Cartesian product of its
+    "algorithms", "datasets" and "sizes", plus optional "pivots", "engines"
+    and "params" (a dict of parameter name -> list of values).
+
+    Raises:
+        ValueError: If the spec is malformed
+    """
+    with open(filepath, 'r') as f:
+        try:
+            spec = json.load(f)
+        except json.JSONDecodeError as e:
+            raise ValueError(f"{filepath} is not valid JSON: {e}")
+
+    experiments = spec.get('experiments')
+    if not isinstance(experiments, list) or not experiments:
+        raise ValueError("Spec must contain a non-empty 'experiments' list")
+    for i, experiment in enumerate(experiments):
+        unknown = set(experiment) - SPEC_FIELDS
+        if unknown:
+            raise ValueError(f"Experiment {i}: unknown field(s) {', '.join(sorted(unknown))}")
+        for field in ('algorithms', 'datasets', 'sizes'):
+            if not experiment.get(field):
+                raise ValueError(f"Experiment {i}: '{field}' must be a non-empty list")
+        if not all(isinstance(n, int) and n >= 0 for n in experiment['sizes']):
+            raise ValueError(f"Experiment {i}: sizes must be non-negative integers")
+        params = experiment.get('params', {})
+        if not isinstance(params, dict) or not all(isinstance(v, list) and v for v in params.values()):
+            raise ValueError(f"Experiment {i}: 'params' must map names to non-empty lists")
+    return spec
+
+
+def expand_params(params):
+    """
+    Cartesian product of a {name: [values]} dict as a list of dicts.
+    """
+    combos = [{}]
+    for name in sorted(params):
+        combos = [dict(combo, **{name: value}) for combo in combos for value in params[name]]
+    return combos
+
+
+def params_text(params):
+    """
+    Canonical text form of a params dict, as stored in the CSV.
+    """
+    return json.dumps(params, sort_keys=True, separators=(',', ':')) if params else ''
+
+
+def config_key(config):
+    """
+    Stable identifier for a configuration (also the shard tie-breaker).
+    """
+    return (config['algorithm'], config['dataset'], config['n'], config['pivot'],
+            config['engine'], params_text(config['params']))
+
+
+def expand_spec(spec, pivot_algorithms, default_pivot, default_engine):
+    """
+    Expand a spec into a de-duplicated, deterministically ordered list of
+    configuration dictionaries.
+
+    Args:
+        spec: Spec dictionary from load_spec()
+        pivot_algorithms: Algorithms that take a pivot strategy; for all
+            others the pivot sweep is ignored
+        default_pivot: Pivot used when an experiment has no "pivots"
+        default_engine: Engine used when an experiment has no "engines"
+
+    Returns:
+        List of configuration dictionaries
+    """
+    configs = []
+    seen = set()
+    for experiment in spec['experiments']:
+        pivots = experiment.get('pivots') or [default_pivot]
+        engines = experiment.get('engines') or [default_engine]
+        for dataset in experiment['datasets']:
+            for n in experiment['sizes']:
+                for algorithm in experiment['algorithms']:
+                    for pivot in (pivots if algorithm in pivot_algorithms else ['']):
+                        for engine in engines:
+                            for params in expand_params(experiment.get('params', {})):
+                                config = {
+                                    'algorithm': algorithm,
+                                    'dataset': dataset,
+                                    'n': n,
+                                    'pivot': pivot,
+                                    'engine': engine,
+                                    'params': params,
+                                }
+                                key = config_key(config)
+                                if key not in seen:
+                                    seen.add(key)
+                                    configs.append(config)
+    return configs
+
+
+def predict_cost(config):
+    """
+    Rough relative cost of one trial, used only to balance shards. It models
+    asymptotic work per algorithm, including quicksort's quadratic cases.
+    """
+    algorithm = config['algorithm']
+    dataset = config['dataset']
+    n = max(config['n'], 1)
+    log_n = math.log2(n) if n > 1 else 1.0
+
+    if algorithm == 'insertion':
+        # Nearly sorted input only shifts elements a short distance
+        if dataset == 'nearly_sorted':
+            return n * 20
+        return n * n / 2 if dataset == 'reverse' else n * n / 4
+    if algorithm == 'quicksort' or algorithm == 'sort_slice':
+        if config['pivot'] == 'first' and dataset in ('reverse', 'nearly_sorted'):
+            return n * n / 2
+        if dataset == 'duplicates':
+            # Lomuto partitioning degrades on long runs of equal values
+            return n * n / 200 + n * log_n
+        return 1.5 * n * log_n
+    if algorithm == 'merge':
+        return 2 * n * log_n
+    if algorithm in ('counting', 'counting_stable', 'bucket'):
+        # Range detection plus one counting/scatter pass and one output pass
+        return 3 * n
+    if algorithm == 'radix':
+        return 4 * n * (8 if dataset in ('strings', 'ids', 'paths', 'hostnames', 'bytes') else 4)
+    # Selection algorithms and anything unknown: treat as linear
+    return 3 * n
+
+
+def parse_shard(text):
+    """
+    Parse "i/N" (1-based) into (i, N).
+
+    Raises:
+        ValueError: If the text is not a valid shard
+    """
+    try:
+        index, count = (int(part) for part in text.split('/'))
+    except ValueError:
+        raise ValueError(f"Shard must look like i/N, got {text!r}")
+    if count < 1 or not 1 <= index <= count:
+        raise ValueError(f"Shard index must be between 1 and N, got {text!r}")
+    return index, count
+
+
+def assign_shards(configs, count):
+    """
+    Longest-processing-time-first assignment: configurations are taken in
+    order of decreasing predicted cost and each goes to the currently
+    lightest shard. Ties break on config_key and shard number, so every
+    machine computes the same assignment from the same spec.
+
+    Returns:
+        Tuple of (list of shard numbers parallel to configs, list of loads)
+    """
+    order = sorted(range(len(configs)), key=lambda i: (-predict_cost(configs[i]), config_key(configs[i])))
+    loads = [0.0] * count
+    assignment = [0] * len(configs)
+    for i in order:
+        shard = min(range(count), key=lambda s: (loads[s], s))
+        assignment[i] = shard + 1
+        loads[shard] += predict_cost(configs[i])
+    return assignment, loads
+
+
+def shard_configs(configs, index, count):
+    """
+    The configurations shard `index` of `count` should run, in their
+    original order.
+    """
+    assignment, _ = assign_shards(configs, count)
+    return [config for config, shard in zip(configs, assignment) if shard == index]
+
+
+def merge_result_files(out_file, input_files, columns):
+    """
+    Combine result CSVs (e.g. one per shard) into one file, dropping rows
+    whose KEY_COLUMNS repeat a row from an earlier input file (overlapping
+    shards). Repeats within one file are separate runs of the same
+    configuration and are all kept. Missing columns in older files are left
+    empty.
+
+    Returns:
+        Tuple of (rows written, duplicate rows dropped)
+    """
+    directory = os.path.dirname(out_file)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+
+    seen = set()
+    written = 0
+    duplicates = 0
+    with open(out_file, 'w', newline='') as out:
+        writer = csv.DictWriter(out, fieldnames=columns, extrasaction='ignore')
+        writer.writeheader()
+        for input_file in input_files:
+            file_keys = set()
+            with open(input_file, 'r', newline='') as f:
+                for row in csv.DictReader(f):
+                    key = tuple(row.get(c) or '' for c in KEY_COLUMNS)
+                    if key in seen:
+                        duplicates += 1
+                        continue
+                    file_keys.add(key)
+                    writer.writerow({c: row.get(c) or '' for c in columns})
+                    written += 1
+            seen |= file_keys
+    return written, duplicates
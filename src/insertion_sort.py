@@ -30,8 +30,9 @@ def insertionSort(numbers):
         comparisons += 1
     return numbers, {'comparisons': comparisons, 'moves': moves}
 
-randList = [random.randint(1,100) for _ in range (100)]
-startTime = time.time()
-insertionSort(randList)
-print("Time to sort : ", insertionSort(randList), " ", time.time()- startTime, "seconds")
+if __name__ == "__main__":
+    randList = [random.randint(1,100) for _ in range (100)]
+    startTime = time.time()
+    insertionSort(randList)
+    print("Time to sort : ", insertionSort(randList), " ", time.time()- startTime, "seconds")
 
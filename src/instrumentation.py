@@ -0,0 +1,168 @@
+import time
+
+
+class PhaseTimers:
+    """
+    Accumulates wall-clock time spent in named algorithm phases.
+
+    Algorithms accept an optional `timers` argument and only touch it when it
+    is not None, so an unprofiled run pays at most one `is None` check per
+    call site and never reads the clock.
+    """
+
+    def __init__(self):
+        self.totals = {}
+        self.counts = {}
+
+    def add(self, phase, seconds):
+        """
+        Record `seconds` spent in `phase`.
+        """
+        self.totals[phase] = self.totals.get(phase, 0.0) + seconds
+        self.counts[phase] = self.counts.get(phase, 0) + 1
+
+    def wrap(self, phase, func):
+        """
+        Return a version of `func` whose calls are timed as `phase`.
+        Nested wrapped calls are counted in both phases.
+        """
+        perf_counter = time.perf_counter
+        add = self.add
+
+        def timed(*args, **kwargs):
+            start = perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                add(phase, perf_counter() - start)
+
+        return timed
+
+    def reset(self):
+        """
+        Clear all accumulated totals.
+        """
+        self.totals.clear()
+        self.counts.clear()
+
+    def as_metrics(self):
+        """
+        Phase totals as metrics entries, e.g. {'partition_ms': 1.234}.
+        """
+        return {f"{phase}_ms": round(seconds * 1000, 3) for phase, seconds in self.totals.items()}
+
+
+class SortObserver:
+    """
+    Hook interface for structural telemetry. Every hook is a no-op here;
+    subclass and override the ones you need.
+
+    Algorithms accept an optional `observer` argument and only call hooks
+    when it is not None, so sorting without an observer costs nothing extra.
+    """
+
+    def on_input(self, numbers):
+        """Called once with the unsorted input (before any work)."""
+
+    def on_depth(self, depth):
+        """Called on entry to each non-trivial recursive call (root is depth 1)."""
+
+    def on_partition(self, left_size, right_size):
+        """Called after quickSort partitions a range around a pivot."""
+
+    def on_merge(self, left, right):
+        """Called before merge_sort merges two sorted halves."""
+
+    def on_bucket_pass(self, pass_index, occupancy):
+        """Called after a radix pass distributes elements; occupancy lists bucket sizes."""
+
+
+def log2_bin(value):
+    """
+    Histogram bin for a positive size: bin b holds values in [2**(b-1), 2**b).
+    """
+    return int(value).bit_length()
+
+
+class StructureRecorder(SortObserver):
+    """
+    Records recursion depth, partition balance, merge sizes, input run
+    lengths and radix bucket occupancy in bounded memory: histograms use a
+    fixed number of ratio bins or log2 size bins, and at most MAX_PASSES
+    radix passes are kept.
+    """
+
+    SPLIT_BINS = 10
+    MAX_PASSES = 64
+
+    def __init__(self):
+        self.runs = 0
+        self.max_depth = 0
+        self.split_histogram = [0] * self.SPLIT_BINS
+        self.merge_size_histogram = {}
+        self.presorted_merges = 0
+        self.run_length_histogram = {}
+        self.bucket_occupancy = {}
+
+    def on_input(self, numbers):
+        self.runs += 1
+        if not numbers:
+            return
+        run_length = 1
+        for i in range(1, len(numbers)):
+            if numbers[i - 1] <= numbers[i]:
+                run_length += 1
+            else:
+                b = log2_bin(run_length)
+                self.run_length_histogram[b] = self.run_length_histogram.get(b, 0) + 1
+                run_length = 1
+        b = log2_bin(run_length)
+        self.run_length_histogram[b] = self.run_length_histogram.get(b, 0) + 1
+
+    def on_depth(self, depth):
+        if depth > self.max_depth:
+            self.max_depth = depth
+
+    def on_partition(self, left_size, right_size):
+        total = left_size + right_size
+        if total == 0:
+            return
+        # Ratio of the smaller side: 0.0 is a degenerate split, 0.5 is perfect
+        ratio = min(left_size, right_size) / total
+        b = min(int(ratio * 2 * self.SPLIT_BINS), self.SPLIT_BINS - 1)
+        self.split_histogram[b] += 1
+
+    def on_merge(self, left, right):
+        b = log2_bin(len(left) + len(right))
+        self.merge_size_histogram[b] = self.merge_size_histogram.get(b, 0) + 1
+        if left and right and left[-1] <= right[0]:
+            self.presorted_merges += 1
+
+    def on_bucket_pass(self, pass_index, occupancy):
+        if pass_index >= self.MAX_PASSES:
+            return
+        totals = self.bucket_occupancy.get(pass_index)
+        if totals is None:
+            totals = self.bucket_occupancy[pass_index] = [0] * len(occupancy)
+        elif len(totals) < len(occupancy):
+            totals.extend([0] * (len(occupancy) - len(totals)))
+        for i, count in enumerate(occupancy):
+            totals[i] += count
+
+    def as_dict(self):
+        """
+        Plain-dict view, with histogram counts averaged per observed run.
+        """
+        runs = self.runs or 1
+        return {
+            'runs': self.runs,
+            'max_depth': self.max_depth,
+            'split_histogram': [round(c / runs, 2) for c in self.split_histogram],
+            'merge_size_histogram': {2 ** (b - 1): round(c / runs, 2)
+                                     for b, c in sorted(self.merge_size_histogram.items())},
+            'presorted_merges': round(self.presorted_merges / runs, 2),
+            'run_length_histogram': {2 ** (b - 1): round(c / runs, 2)
+                                     for b, c in sorted(self.run_length_histogram.items())},
+            'bucket_occupancy': {p: [round(c / runs, 2) for c in occ]
+                                 for p, occ in sorted(self.bucket_occupancy.items())},
+        }
@@ -1,12 +1,16 @@
 import time, random
 
-def merge_sort(numbers, metricsList={'comparisons': 0, 'moves': 0}):
+def merge_sort(numbers, metricsList={'comparisons': 0, 'moves': 0}, timers=None, observer=None, _depth=1):
 	"""
 	Sorts a list using a merge sort algorithm.
 	
 	Args: 
         numbers (list[int]): The list of integers to sort.
         metricsList (dict): A dictionary to accumulate performance metrics.
+        timers (PhaseTimers, optional): Records time spent in the 'split'
+            and 'merge' phases.
+        observer (SortObserver, optional): Receives recursion depth and the
+            halves being merged.
     Returns:
         tuple: A tuple containing the sorted list and a metrics dictionary.
             - sorted list (list[int])
@@ -15,16 +19,30 @@ def merge_sort(numbers, metricsList={'comparisons': 0, 'moves': 0}):
                 - 'moves': Number of element moves during sorting
 	"""
 	sortedList = numbers
+	if observer is not None and _depth == 1:
+		observer.on_input(numbers)
 	
 	if len(numbers) > 1:
+		if observer is not None:
+			observer.on_depth(_depth)
+		if timers is not None:
+			start = time.perf_counter()
 		pivot_index = len(numbers)//2
 		left = numbers[:pivot_index]
 		right = numbers[pivot_index:]
+		if timers is not None:
+			timers.add('split', time.perf_counter() - start)
 
-		left_sorted, left_metrics = merge_sort(left, metricsList)
-		right_sorted, right_metrics = merge_sort(right, metricsList)
+		left_sorted, left_metrics = merge_sort(left, metricsList, timers, observer, _depth + 1)
+		right_sorted, right_metrics = merge_sort(right, metricsList, timers, observer, _depth + 1)
+		if observer is not None:
+			observer.on_merge(left_sorted, right_sorted)
 
+		if timers is not None:
+			start = time.perf_counter()
 		sortedList, metricsList = merge(left_sorted, right_sorted)
+		if timers is not None:
+			timers.add('merge', time.perf_counter() - start)
 		metricsList['comparisons'] += left_metrics['comparisons'] + right_metrics['comparisons']
 		metricsList['moves'] += left_metrics['moves'] + right_metrics['moves']
 	
@@ -53,13 +71,15 @@ def merge(left, right):
 	return sortedList, {'comparisons': comparisons, 'moves': moves}
 
 
-t = time.time()
-metrics = merge_sort([2,6,1,4,3,8])[1]
-metrics['elapsed seconds'] = time.time() - t
-print(metrics)
 
+if __name__ == "__main__":
+	t = time.time()
+	metrics = merge_sort([2,6,1,4,3,8])[1]
+	metrics['elapsed seconds'] = time.time() - t
+	print(metrics)
 
-t = time.time()
-metrics = merge_sort([random.randint(1,100) for _ in range(200000)])[1]
-metrics['elapsed seconds'] = time.time() - t
-print(metrics)
+
+	t = time.time()
+	metrics = merge_sort([random.randint(1,100) for _ in range(200000)])[1]
+	metrics['elapsed seconds'] = time.time() - t
+	print(metrics)
@@ -0,0 +1,212 @@
+import math
+import os
+import sys
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+from merge_sort import merge, merge_sort
+from quicksort import makePartitioner, quickSort
+
+# Subranges smaller than this are sorted serially inside one task
+PARALLEL_CUTOFF = 4096
+# Fork until there are about 2**FORK_DEPTH_SLACK tasks per thread
+FORK_DEPTH_SLACK = 2
+DEFAULT_THREADS = os.cpu_count() or 1
+
+# Warm pools keyed by thread count, so timed runs do not pay thread startup
+_pools = {}
+
+
+def gil_enabled():
+    """
+    True unless this is a free-threaded build (3.13t and later) running with
+    the GIL disabled. Checked at call time: importing an extension that does
+    not support free threading can re-enable the GIL.
+    """
+    is_gil_enabled = getattr(sys, '_is_gil_enabled', None)
+    return True if is_gil_enabled is None else is_gil_enabled()
+
+
+def effective_threads(threads=None):
+    """
+    Number of threads a parallel sort will actually use: 1 while the GIL is
+    enabled (threads would only add overhead), otherwise `threads`.
+
+    Raises:
+        ValueError: If threads is less than 1
+    """
+    if threads is None:
+        threads = DEFAULT_THREADS
+    if threads < 1:
+        raise ValueError(f"threads must be at least 1, got {threads}")
+    return 1 if gil_enabled() else threads
+
+
+def fork_depth(threads):
+    """
+    Maximum depth at which subranges are still split into separate tasks.
+    """
+    return math.ceil(math.log2(threads)) + FORK_DEPTH_SLACK
+
+
+def get_pool(threads):
+    pool = _pools.get(threads)
+    if pool is None:
+        pool = _pools[threads] = ThreadPoolExecutor(max_workers=threads, thread_name_prefix='sort')
+    return pool
+
+
+def add_into(total, metrics):
+    total['comparisons'] += metrics['comparisons']
+    total['moves'] += metrics['moves']
+
+
+def sort_range(targetList, lowIndex, highIndex, partitionArray):
+    """
+    Serial in-place quicksort of targetList[lowIndex..highIndex]. Recursing
+    into the smaller side keeps a worker thread's stack at O(log n) even
+    when the pivot strategy degenerates.
+    """
+    while lowIndex < highIndex:
+        partitionIndex = partitionArray(targetList, lowIndex, highIndex)
+        if partitionIndex - lowIndex < highIndex - partitionIndex:
+            sort_range(targetList, lowIndex, partitionIndex - 1, partitionArray)
+            lowIndex = partitionIndex + 1
+        else:
+            sort_range(targetList, partitionIndex + 1, highIndex, partitionArray)
+            highIndex = partitionIndex - 1
+
+
+def quick_sort_task(targetList, lowIndex, highIndex, depth, pivot, cutoff, maxDepth):
+    """
+    One quicksort task: partition a large range and hand both sides back as
+    new tasks, or sort a small (or deep) range to completion.
+
+    Returns:
+        tuple: (metrics, list of (lowIndex, highIndex, depth) to fork)
+    """
+    # Counters live in the partitioner's closure, so each task gets its own
+    _, _, _, partitionArray, readMetrics = makePartitioner(pivot)
+    if depth < maxDepth and highIndex - lowIndex + 1 >= cutoff:
+        partitionIndex = partitionArray(targetList, lowIndex, highIndex)
+        children = [(low, high, depth + 1)
+                    for low, high in ((lowIndex, partitionIndex - 1), (partitionIndex + 1, highIndex))
+                    if low < high]
+        return readMetrics(), children
+    sort_range(targetList, lowIndex, highIndex, partitionArray)
+    return readMetrics(), []
+
+
+def parallel_quick_sort(a, pivot="median3", threads=None, cutoff=PARALLEL_CUTOFF):
+    """
+    Sorts a copy of the list with quickSort's partitioning on a thread pool.
+
+    Every partitioned subrange becomes a new task until it is smaller than
+    `cutoff` or deeper than fork_depth(threads); all tasks work in place on
+    one shared list. Tasks never wait on each other: the calling thread
+    collects finished partitions and submits their subranges. Falls back to
+    quickSort when the GIL is enabled.
+
+    Args:
+        a (list[int]): The list of integers to sort.
+        pivot (str): The pivot selection strategy ("first" or "median3").
+        threads (int, optional): Worker threads (default: os.cpu_count()).
+        cutoff (int): Smallest subrange that is split into further tasks.
+    Returns:
+        tuple: (sorted list, metrics) with the same 'comparisons' and
+            'moves' as the serial quickSort, since partitioning is unchanged.
+    """
+    threads = effective_threads(threads)
+    if threads == 1 or len(a) < cutoff:
+        return quickSort(a, pivot)
+
+    listToSort = a[:]
+    maxDepth = fork_depth(threads)
+    pool = get_pool(threads)
+    metrics = {'comparisons': 0, 'moves': 0}
+    pending = {pool.submit(quick_sort_task, listToSort, 0, len(listToSort) - 1, 0, pivot, cutoff, maxDepth)}
+    while pending:
+        done, pending = wait(pending, return_when=FIRST_COMPLETED)
+        for future in done:
+            taskMetrics, children = future.result()
+            add_into(metrics, taskMetrics)
+            for lowIndex, highIndex, depth in children:
+                pending.add(pool.submit(quick_sort_task, listToSort, lowIndex, highIndex,
+                                        depth, pivot, cutoff, maxDepth))
+    return listToSort, metrics
+
+
+def sort_leaf(shared, low, high):
+    """
+    merge_sort one leaf range of the shared list and write it back in place.
+    """
+    sortedList, metrics = merge_sort(shared[low:high])
+    shared[low:high] = sortedList
+    return metrics
+
+
+def merge_ranges(shared, low, mid, high):
+    """
+    Merge the sorted ranges [low, mid) and [mid, high) of the shared list.
+    """
+    mergedList, metrics = merge(shared[low:mid], shared[mid:high])
+    shared[low:high] = mergedList
+    return metrics
+
+
+def parallel_merge_sort(numbers, threads=None, cutoff=PARALLEL_CUTOFF):
+    """
+    Sorts a list with merge_sort's halving on a thread pool.
+
+    The list is halved exactly as merge_sort does until a range is smaller
+    than `cutoff` or deeper than fork_depth(threads). Leaves are sorted by
+    merge_sort in parallel, and each pair of sibling ranges is merged as soon
+    as both are ready, writing back into one shared list. Falls back to
+    merge_sort when the GIL is enabled.
+
+    Args:
+        numbers (list[int]): The list of integers to sort.
+        threads (int, optional): Worker threads (default: os.cpu_count()).
+        cutoff (int): Smallest range that is split into further tasks.
+    Returns:
+        tuple: (sorted list, metrics) with the same 'comparisons' and
+            'moves' as the serial merge_sort.
+    """
+    threads = effective_threads(threads)
+    if threads == 1 or len(numbers) < cutoff:
+        sortedList, metrics = merge_sort(numbers)
+        return sortedList, dict(metrics)
+
+    shared = numbers[:]
+    maxDepth = fork_depth(threads)
+    parents = {}
+    unfinished = {}
+    leaves = []
+
+    def split(low, high, depth):
+        if depth < maxDepth and high - low >= cutoff:
+            mid = low + (high - low) // 2
+            node = (low, mid, high)
+            unfinished[node] = 2
+            parents[(low, mid)] = parents[(mid, high)] = node
+            split(low, mid, depth + 1)
+            split(mid, high, depth + 1)
+        else:
+            leaves.append((low, high))
+
+    split(0, len(shared), 0)
+
+    pool = get_pool(threads)
+    metrics = {'comparisons': 0, 'moves': 0}
+    pending = {pool.submit(sort_leaf, shared, low, high): (low, high) for low, high in leaves}
+    while pending:
+        done, _ = wait(pending, return_when=FIRST_COMPLETED)
+        for future in done:
+            low, high = pending.pop(future)
+            add_into(metrics, future.result())
+            node = parents.get((low, high))
+            if node is None:
+                continue
+            unfinished[node] -= 1
+            if unfinished[node] == 0:
+                pending[pool.submit(merge_ranges, shared, *node)] = (node[0], node[2])
+    return shared, metrics
@@ -0,0 +1,85 @@
+import os
+import pstats
+
+# Recorded by cProfile itself each time profiling stops
+PROFILER_FRAMES = {"<method 'disable' of '_lsprof.Profiler' objects>"}
+
+
+def frame_label(func):
+    """
+    Readable flamegraph frame name for a pstats function key.
+    """
+    filename, line, name = func
+    if filename == '~':
+        # Built-ins have no source location
+        return name
+    return f"{name} ({os.path.basename(filename)}:{line})"
+
+
+def collapse_stats(stats, max_depth=64):
+    """
+    Convert pstats data into collapsed stacks ("a;b;c value" lines) as read
+    by flamegraph.pl, speedscope and inferno.
+
+    cProfile only keeps caller -> callee edges, not full stacks, so each
+    function's own time is split across its callers in proportion to the
+    cumulative time recorded on each edge. Recursive edges are folded so
+    that quickSortRecursive appears once per stack instead of once per level.
+
+    Args:
+        stats: The `stats` dictionary of a pstats.Stats object
+        max_depth: Stop walking up the call graph after this many frames
+
+    Returns:
+        Dictionary mapping collapsed stack strings to microseconds
+    """
+    collapsed = {}
+
+    def walk(func, stack, weight, visited):
+        callers = {
+            caller: edge for caller, edge in stats[func][4].items()
+            if caller in stats and caller not in visited
+        }
+        if not callers or len(stack) >= max_depth:
+            key = ';'.join(frame_label(f) for f in reversed(stack))
+            collapsed[key] = collapsed.get(key, 0.0) + weight
+            return
+
+        total = sum(edge[3] for edge in callers.values())
+        for caller, edge in callers.items():
+            if total > 0:
+                share = edge[3] / total
+            else:
+                share = 1 / len(callers)
+            if share > 0:
+                walk(caller, stack + [caller], weight * share, visited | {caller})
+
+    for func, (_, _, own_time, _, _) in stats.items():
+        if own_time > 0 and func[2] not in PROFILER_FRAMES:
+            walk(func, [func], own_time * 1e6, {func})
+
+    return {stack: round(us) for stack, us in collapsed.items() if round(us) > 0}
+
+
+def write_profile(profiler, basepath):
+    """
+    Write `<basepath>.prof` (pstats, for snakeviz/pstats) and
+    `<basepath>.collapsed` (for flamegraph tools).
+
+    Returns:
+        Tuple of (prof path, collapsed path)
+    """
+    directory = os.path.dirname(basepath)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+
+    prof_path = basepath + '.prof'
+    collapsed_path = basepath + '.collapsed'
+    profiler.dump_stats(prof_path)
+
+    collapsed = collapse_stats(pstats.Stats(profiler).stats)
+    with open(collapsed_path, 'w') as f:
+        for stack, value in sorted(collapsed.items()):
+            f.write(f"{stack} {value}\n")
+
+    return prof_path, collapsed_path
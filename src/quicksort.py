@@ -2,25 +2,26 @@ import random
 import time
 import sys
 
-def quickSort(a: list[int], pivot: str = "median3") -> tuple[list[int], dict]:
+def makePartitioner(pivot: str = "median3", wrap=None):
     """
-    Sorts a list and counts its internal operations (Internal Instrumentation).
-    NOTE: This function does NOT know it is being timed.
+    Builds the counting pivot/partition helpers used by quickSort and by the
+    selection APIs in selection.py. The helpers share one pair of counters.
 
-    Args: 
-        a (list[int]): The list of integers to sort.
+    Args:
         pivot (str): The pivot selection strategy ("first" or "median3").
+        wrap (callable, optional): wrap(phase, func) -> func, used to time
+            the 'pivot' and 'partition' phases.
     Returns:
-        tuple: A tuple containing the sorted list and a metrics dictionary.
-            - sorted list (list[int])
-            - metrics (dict): Dictionary with performance metrics
-                - 'comparisons': Number of comparisons made during sorting
-                - 'moves': Number of element moves during sorting
+        tuple: (swapElements, choosePivot, partitionAroundLast,
+            partitionArray, readMetrics)
+            - partitionAroundLast partitions around the value already at
+              highIndex and returns its final index
+            - partitionArray chooses a pivot, then partitions around it
+            - readMetrics returns {'comparisons': ..., 'moves': ...}
     """
     comparisonCount = 0
     moveCount = 0
-    listToSort = a[:]
-    
+
     def swapElements(targetList, indexOne, indexTwo):
         nonlocal moveCount
         if indexOne != indexTwo:
@@ -46,9 +47,8 @@ def quickSort(a: list[int], pivot: str = "median3") -> tuple[list[int], dict]:
             swapElements(targetList, midIndex, highIndex)
             return
 
-    def partitionArray(targetList, lowIndex, highIndex):
+    def partitionAroundLast(targetList, lowIndex, highIndex):
         nonlocal comparisonCount
-        choosePivot(targetList, lowIndex, highIndex)
         pivotValue = targetList[highIndex]
         i = lowIndex - 1
         for j in range(lowIndex, highIndex):
@@ -59,17 +59,70 @@ def quickSort(a: list[int], pivot: str = "median3") -> tuple[list[int], dict]:
         swapElements(targetList, i + 1, highIndex)
         return i + 1
 
+    if wrap is not None:
+        choosePivot = wrap('pivot', choosePivot)
+
+    def partitionArray(targetList, lowIndex, highIndex):
+        choosePivot(targetList, lowIndex, highIndex)
+        return partitionAroundLast(targetList, lowIndex, highIndex)
+
+    if wrap is not None:
+        partitionArray = wrap('partition', partitionArray)
+
+    def readMetrics():
+        return {'comparisons': comparisonCount, 'moves': moveCount}
+
+    return swapElements, choosePivot, partitionAroundLast, partitionArray, readMetrics
+
+
+def quickSort(a: list[int], pivot: str = "median3", timers=None, observer=None) -> tuple[list[int], dict]:
+    """
+    Sorts a list and counts its internal operations (Internal Instrumentation).
+    NOTE: This function does NOT know it is being timed.
+
+    Args: 
+        a (list[int]): The list of integers to sort.
+        pivot (str): The pivot selection strategy ("first" or "median3").
+        timers (PhaseTimers, optional): Records time spent in the
+            'partition' and 'pivot' phases (partition includes pivot).
+        observer (SortObserver, optional): Receives recursion depth and
+            partition split sizes.
+    Returns:
+        tuple: A tuple containing the sorted list and a metrics dictionary.
+            - sorted list (list[int])
+            - metrics (dict): Dictionary with performance metrics
+                - 'comparisons': Number of comparisons made during sorting
+                - 'moves': Number of element moves during sorting
+    """
+    listToSort = a[:]
+    # Passing timers.wrap times the 'pivot' and 'partition' phases; without
+    # timers the helpers are plain closures with no timing checks at all
+    wrap = timers.wrap if timers is not None else None
+    _, _, _, partitionArray, readMetrics = makePartitioner(pivot, wrap)
+
     def quickSortRecursive(targetList, lowIndex, highIndex):
         if lowIndex < highIndex:
             partitionIndex = partitionArray(targetList, lowIndex, highIndex)
             quickSortRecursive(targetList, lowIndex, partitionIndex - 1)
             quickSortRecursive(targetList, partitionIndex + 1, highIndex)
 
-    if listToSort:
+    def quickSortObserved(targetList, lowIndex, highIndex, depth):
+        if lowIndex < highIndex:
+            observer.on_depth(depth)
+            partitionIndex = partitionArray(targetList, lowIndex, highIndex)
+            observer.on_partition(partitionIndex - lowIndex, highIndex - partitionIndex)
+            quickSortObserved(targetList, lowIndex, partitionIndex - 1, depth + 1)
+            quickSortObserved(targetList, partitionIndex + 1, highIndex, depth + 1)
+
+    if observer is not None:
+        observer.on_input(listToSort)
+        if listToSort:
+            quickSortObserved(listToSort, 0, len(listToSort) - 1, 1)
+    elif listToSort:
         quickSortRecursive(listToSort, 0, len(listToSort) - 1)
         
     # The algorithm's "contract" is to return the sorted list AND its metrics.
-    metrics = {'comparisons': comparisonCount, 'moves': moveCount}
+    metrics = readMetrics()
     return listToSort, metrics
 
 # Set a higher recursion limit for deep recursion on large datasets
@@ -1,10 +1,18 @@
-def radix_sort(numbers):
+import time
+
+
+def radix_sort(numbers, timers=None, observer=None):
     """
     Sorts a list of integers using LSD (Least Significant Digit) radix sort.
-    Handles both positive and negative integers.
+    Handles both positive and negative integers. Lists of str or bytes keys
+    are sorted with msd_radix_sort instead.
     
     Args:
-        numbers: List of integers to be sorted
+        numbers: List of integers (or str/bytes keys) to be sorted
+        timers: Optional PhaseTimers recording the 'distribution'
+            (scatter into buckets), 'collection' (gather back) and
+            'sign_fixup' phases
+        observer: Optional SortObserver receiving per-pass bucket occupancy
         
     Returns:
         tuple: A tuple containing the sorted list and a metrics dictionary.
@@ -13,6 +21,12 @@ def radix_sort(numbers):
                 - 'comparisons': Number of comparisons made during sorting
                 - 'moves': Number of element moves during sorting
     """
+    if numbers and isinstance(numbers[0], (str, bytes)):
+        return msd_radix_sort(numbers, timers, observer)
+    
+    if observer is not None:
+        observer.on_input(numbers)
+    
     # Early exit for edge cases
     if not numbers:
         return [], {'moves': 0}
@@ -40,19 +54,31 @@ def radix_sort(numbers):
         for key in buckets:
             buckets[key] = []
         
+        if timers is not None:
+            start = time.perf_counter()
         for num in numbers:
             digit = get_abs_digit(num, place)
             buckets[digit].append(num)
             move_count += 1
+        if timers is not None:
+            timers.add('distribution', time.perf_counter() - start)
+        if observer is not None:
+            observer.on_bucket_pass(digit_position, [len(buckets[key]) for key in range(10)])
+        if timers is not None:
+            start = time.perf_counter()
         
         i = 0
         for key in range(10):
             for num in buckets[key]:
                 numbers[i] = num
                 i += 1
+        if timers is not None:
+            timers.add('collection', time.perf_counter() - start)
         
         place *= 10
     
+    if timers is not None:
+        start = time.perf_counter()
     # Handle negatives by sorting to beginning and reversing
     negatives = [num for num in numbers if num < 0]
     positives = [num for num in numbers if num >= 0]
@@ -65,6 +91,8 @@ def radix_sort(numbers):
     for pos in positives:
         result.append(pos)
         move_count += 1
+    if timers is not None:
+        timers.add('sign_fixup', time.perf_counter() - start)
     
     metrics = {
         'moves': move_count,
@@ -112,3 +140,140 @@ def get_abs_digit(num, place):
         Single digit (0-9) at the specified place
     """
     return (abs(num) // place) % 10
+
+
+# Ranges this small are finished with insertion sort instead of another
+# 257-bucket distribution pass
+MSD_INSERTION_CUTOFF = 16
+
+
+def msd_radix_sort(keys, timers=None, observer=None):
+    """
+    Sorts str or bytes keys using MSD (Most Significant Digit) radix sort,
+    one byte at a time. Strings are compared by their UTF-8 encoding, which
+    gives the same order as Python's str comparison.
+    
+    Each range first skips the prefix shared by all of its keys, then
+    distributes keys into 257 buckets (one for keys that end at this byte,
+    one per byte value). Ranges of MSD_INSERTION_CUTOFF keys or fewer are
+    finished with insertion sort.
+    
+    Args:
+        keys: List of str, or list of bytes, to be sorted
+        timers: Optional PhaseTimers recording the 'prefix_skip',
+            'distribution' and 'collection' phases
+        observer: Optional SortObserver receiving recursion depth and
+            per-level bucket occupancy
+        
+    Returns:
+        tuple: A tuple containing the sorted list and a metrics dictionary.
+            - sorted list (list[str] or list[bytes])
+            - metrics (dict): Dictionary with performance metrics
+                - 'comparisons': Byte and key comparisons made during sorting
+                - 'moves': Number of element moves during sorting
+    """
+    if observer is not None:
+        observer.on_input(keys)
+    
+    if not keys:
+        return [], {'comparisons': 0, 'moves': 0}
+    
+    # Input Validation
+    if all(isinstance(key, bytes) for key in keys):
+        items = [(key, key) for key in keys]
+    elif all(isinstance(key, str) for key in keys):
+        items = [(key.encode('utf-8'), key) for key in keys]
+    else:
+        raise ValueError("All elements must be str, or all elements must be bytes")
+    
+    comparison_count = 0
+    move_count = 0
+    aux = [None] * len(items)
+    
+    # Explicit stack of (low, high, byte depth, level) instead of recursion,
+    # so long keys cannot hit the recursion limit
+    stack = [(0, len(items), 0, 1)]
+    while stack:
+        low, high, depth, level = stack.pop()
+        if observer is not None:
+            observer.on_depth(level)
+        
+        if high - low <= MSD_INSERTION_CUTOFF:
+            # Keys in this range share bytes [0, depth), so comparing whole
+            # keys orders them by their remaining bytes
+            for i in range(low + 1, high):
+                item = items[i]
+                j = i - 1
+                while j >= low:
+                    comparison_count += 1
+                    if items[j][0] <= item[0]:
+                        break
+                    items[j + 1] = items[j]
+                    move_count += 1
+                    j -= 1
+                items[j + 1] = item
+                move_count += 1
+            continue
+        
+        if timers is not None:
+            start = time.perf_counter()
+        # Skip the prefix every key in the range shares
+        first = items[low][0]
+        prefix_end = len(first)
+        for i in range(low + 1, high):
+            key = items[i][0]
+            limit = min(prefix_end, len(key))
+            j = depth
+            while j < limit and key[j] == first[j]:
+                j += 1
+            comparison_count += j - depth + 1
+            prefix_end = j
+            if prefix_end == depth:
+                break
+        depth = prefix_end
+        if timers is not None:
+            timers.add('prefix_skip', time.perf_counter() - start)
+            start = time.perf_counter()
+        
+        # Counting pass: bucket 0 holds keys that end at this depth
+        counts = [0] * 257
+        for i in range(low, high):
+            key = items[i][0]
+            counts[key[depth] + 1 if depth < len(key) else 0] += 1
+        if observer is not None:
+            observer.on_bucket_pass(level - 1, counts)
+        
+        starts = [0] * 257
+        position = low
+        for bucket in range(257):
+            starts[bucket] = position
+            position += counts[bucket]
+        
+        next_slot = starts[:]
+        for i in range(low, high):
+            item = items[i]
+            key = item[0]
+            bucket = key[depth] + 1 if depth < len(key) else 0
+            aux[next_slot[bucket]] = item
+            next_slot[bucket] += 1
+            move_count += 1
+        if timers is not None:
+            timers.add('distribution', time.perf_counter() - start)
+            start = time.perf_counter()
+        
+        items[low:high] = aux[low:high]
+        move_count += high - low
+        if timers is not None:
+            timers.add('collection', time.perf_counter() - start)
+        
+        # Keys in bucket 0 are all equal, so only byte buckets need sorting
+        for bucket in range(1, 257):
+            if counts[bucket] > 1:
+                stack.append((starts[bucket], starts[bucket] + counts[bucket], depth + 1, level + 1))
+    
+    metrics = {
+        'comparisons': comparison_count,
+        'moves': move_count,
+    }
+    
+    return [item[1] for item in items], metrics
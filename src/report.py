@@ -0,0 +1,309 @@
+import csv
+import json
+import math
+import os
+
+QUANTILES = (0.5, 0.95, 0.99)
+# Groups up to this size get exact quantiles; larger ones switch to P-square
+EXACT_LIMIT = 128
+# Bump when summaries change so stale .summary.json caches are rebuilt
+SUMMARY_VERSION = 2
+SUMMARY_COLUMNS = ['count', 'mean', 'std', 'min', 'p50', 'p95', 'p99', 'max']
+
+
+class RunningStats:
+    """
+    Welford's online mean/variance with min and max: O(1) memory and
+    numerically stable for long streams.
+    """
+
+    def __init__(self):
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+
+    def add(self, x):
+        self.count += 1
+        delta = x - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (x - self.mean)
+        if x < self.min:
+            self.min = x
+        if x > self.max:
+            self.max = x
+
+    def variance(self):
+        """
+        Sample variance (0.0 with fewer than two values).
+        """
+        if self.count < 2:
+            return 0.0
+        return self.m2 / (self.count - 1)
+
+    def std(self):
+        return math.sqrt(self.variance())
+
+
+class P2Quantile:
+    """
+    Streaming quantile estimate. The first EXACT_LIMIT values are buffered
+    and give exact quantiles; after that the P-square algorithm (Jain and
+    Chlamtac, 1985) takes over: five markers track the minimum, the p/2, p
+    and (1+p)/2 quantiles and the maximum, adjusted with piecewise-parabolic
+    interpolation as values arrive. Memory is constant.
+    """
+
+    def __init__(self, p):
+        self.p = p
+        self.initial = []
+        self.heights = None
+        self.positions = None
+        self.desired = None
+        self.increments = None
+
+    def add(self, x):
+        if self.heights is None:
+            self.initial.append(x)
+            if len(self.initial) > EXACT_LIMIT:
+                self._start_markers()
+            return
+        self._update_markers(x)
+
+    def _start_markers(self):
+        """
+        Place the five markers on the buffered values, at the positions
+        P-square would have reached after seeing them.
+        """
+        p = self.p
+        values = sorted(self.initial)
+        count = len(values)
+        self.increments = [0, p / 2, p, (1 + p) / 2, 1]
+        self.desired = [1 + (count - 1) * f for f in self.increments]
+        # Marker positions must be strictly increasing integers in [1, count]
+        positions = [1 + round((count - 1) * f) for f in self.increments]
+        for i in range(1, 5):
+            positions[i] = max(positions[i], positions[i - 1] + 1)
+        positions[4] = count
+        for i in range(3, -1, -1):
+            positions[i] = min(positions[i], positions[i + 1] - 1)
+        self.positions = positions
+        self.heights = [values[n - 1] for n in positions]
+        self.initial = []
+
+    def _update_markers(self, x):
+        q = self.heights
+        n = self.positions
+        if x < q[0]:
+            q[0] = x
+            k = 0
+        elif x >= q[4]:
+            q[4] = x
+            k = 3
+        else:
+            k = 0
+            while x >= q[k + 1]:
+                k += 1
+
+        for i in range(k + 1, 5):
+            n[i] += 1
+        for i in range(5):
+            self.desired[i] += self.increments[i]
+
+        for i in range(1, 4):
+            d = self.desired[i] - n[i]
+            if (d >= 1 and n[i + 1] - n[i] > 1) or (d <= -1 and n[i - 1] - n[i] < -1):
+                d = 1 if d > 0 else -1
+                candidate = self._parabolic(i, d)
+                if q[i - 1] < candidate < q[i + 1]:
+                    q[i] = candidate
+                else:
+                    q[i] = q[i] + d * (q[i + d] - q[i]) / (n[i + d] - n[i])
+                n[i] += d
+
+    def _parabolic(self, i, d):
+        q = self.heights
+        n = self.positions
+        return q[i] + d / (n[i + 1] - n[i - 1]) * (
+            (n[i] - n[i - 1] + d) * (q[i + 1] - q[i]) / (n[i + 1] - n[i])
+            + (n[i + 1] - n[i] - d) * (q[i] - q[i - 1]) / (n[i] - n[i - 1])
+        )
+
+    def value(self):
+        """
+        Current estimate (exact while at most EXACT_LIMIT values were seen).
+        """
+        if self.heights is not None:
+            return self.heights[2]
+        if not self.initial:
+            return None
+        values = sorted(self.initial)
+        position = self.p * (len(values) - 1)
+        low = int(position)
+        high = min(low + 1, len(values) - 1)
+        return values[low] + (values[high] - values[low]) * (position - low)
+
+
+class GroupSummary:
+    """
+    Constant-memory summary of one group: Welford statistics plus one P2
+    estimator per reported quantile.
+    """
+
+    def __init__(self):
+        self.stats = RunningStats()
+        self.quantiles = [P2Quantile(p) for p in QUANTILES]
+
+    def add(self, x):
+        self.stats.add(x)
+        for estimator in self.quantiles:
+            estimator.add(x)
+
+    def as_row(self):
+        stats = self.stats
+        p50, p95, p99 = (estimator.value() for estimator in self.quantiles)
+        return {
+            'count': stats.count,
+            'mean': stats.mean,
+            'std': stats.std(),
+            'min': stats.min,
+            'p50': p50,
+            'p95': p95,
+            'p99': p99,
+            'max': stats.max,
+        }
+
+
+def aggregate_csv(csv_file, group_by, value_column='ms'):
+    """
+    Stream a results CSV once and summarize `value_column` per group.
+
+    Args:
+        csv_file: Path to the results CSV
+        group_by: List of column names to group by (may be empty)
+        value_column: Numeric column to summarize
+
+    Returns:
+        List of (group key tuple, summary row dict), sorted by key
+
+    Raises:
+        ValueError: If a requested column is missing from the file
+    """
+    groups = {}
+    with open(csv_file, 'r', newline='') as f:
+        reader = csv.DictReader(f)
+        columns = reader.fieldnames or []
+        missing = [c for c in list(group_by) + [value_column] if c not in columns]
+        if missing:
+            raise ValueError(f"Unknown column(s) {', '.join(missing)}; available: {', '.join(columns)}")
+
+        for row in reader:
+            try:
+                value = float(row[value_column])
+            except (TypeError, ValueError):
+                continue
+            key = tuple(row[c] for c in group_by)
+            summary = groups.get(key)
+            if summary is None:
+                summary = groups[key] = GroupSummary()
+            summary.add(value)
+
+    return [(key, groups[key].as_row()) for key in sorted(groups, key=sort_key)]
+
+
+def sort_key(key):
+    """
+    Sort group keys numerically where a column looks like a number.
+    """
+    parts = []
+    for part in key:
+        try:
+            parts.append((0, float(part), ''))
+        except ValueError:
+            parts.append((1, 0.0, part))
+    return parts
+
+
+def file_signature(path):
+    """
+    Size and modification time; any append or rewrite changes it.
+    """
+    st = os.stat(path)
+    return [st.st_size, st.st_mtime_ns]
+
+
+def cache_path(csv_file):
+    return csv_file + '.summary.json'
+
+
+def load_summary(csv_file, group_by, value_column='ms', use_cache=True):
+    """
+    Summaries for `csv_file`, served from `<csv_file>.summary.json` when the
+    results file has not changed since the summary was built.
+
+    Returns:
+        Tuple of (list of (key, row) pairs, True if served from cache)
+    """
+    cache_file = cache_path(csv_file)
+    entry_key = f"{','.join(group_by)}|{value_column}"
+    signature = file_signature(csv_file)
+
+    cache = {'signature': signature, 'version': SUMMARY_VERSION, 'summaries': {}}
+    if use_cache and os.path.exists(cache_file):
+        try:
+            with open(cache_file, 'r') as f:
+                stored = json.load(f)
+            if stored.get('signature') == signature and stored.get('version') == SUMMARY_VERSION:
+                cache = stored
+        except (OSError, ValueError):
+            pass
+
+    cached = cache['summaries'].get(entry_key)
+    if cached is not None:
+        return [(tuple(key), row) for key, row in cached], True
+
+    summary = aggregate_csv(csv_file, group_by, value_column)
+    if use_cache:
+        cache['summaries'][entry_key] = [[list(key), row] for key, row in summary]
+        try:
+            with open(cache_file, 'w') as f:
+                json.dump(cache, f)
+        except OSError:
+            pass
+    return summary, False
+
+
+def write_summary(summary, group_by, out_file):
+    """
+    Write the summary table as CSV: group columns followed by SUMMARY_COLUMNS.
+    """
+    directory = os.path.dirname(out_file)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    with open(out_file, 'w', newline='') as f:
+        writer = csv.writer(f)
+        writer.writerow(list(group_by) + SUMMARY_COLUMNS)
+        for key, row in summary:
+            writer.writerow(list(key) + [
+                row['count'] if c == 'count' else f"{row[c]:.3f}" for c in SUMMARY_COLUMNS
+            ])
+
+
+def print_report(summary, group_by, value_column='ms'):
+    """
+    Print the summary table.
+    """
+    widths = [max([len(c)] + [len(str(key[i])) for key, _ in summary]) for i, c in enumerate(group_by)]
+    header = " | ".join(c.ljust(w) for c, w in zip(group_by, widths))
+    stats_header = " | ".join(f"{c:>9s}" for c in SUMMARY_COLUMNS)
+    print(f"{header} | {stats_header}" if group_by else stats_header)
+    print("-" * (len(header) + len(stats_header) + 3))
+    for key, row in summary:
+        cells = " | ".join(str(k).ljust(w) for k, w in zip(key, widths))
+        values = " | ".join(
+            f"{row[c]:9d}" if c == 'count' else f"{row[c]:9.3f}" for c in SUMMARY_COLUMNS
+        )
+        print(f"{cells} | {values}" if group_by else values)
+    print(f"\n({value_column}; p50/p95/p99 are exact up to {EXACT_LIMIT} values per group, "
+          f"P-square estimates beyond)")
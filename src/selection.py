@@ -0,0 +1,244 @@
+import heapq
+
+from quicksort import makePartitioner
+
+# Quickselect partitions at most this many times n elements before switching
+# to median-of-medians pivots, which bounds the total work to O(n).
+WORK_LIMIT_FACTOR = 4
+GROUP_SIZE = 5
+
+
+def makeSelector(pivot: str = "median3"):
+    """
+    Builds an introselect routine on top of quickSort's partition helpers.
+
+    Quickselect uses choosePivot/partitionArray from quicksort.py until it has
+    done WORK_LIMIT_FACTOR * n partitioning work, then falls back to
+    median-of-medians pivots with a three-way split so that runs of equal
+    values cannot stall it either. This guarantees linear time.
+
+    Args:
+        pivot (str): The quickSort pivot strategy used before the fallback.
+    Returns:
+        tuple: (selectRange, sortRange, readMetrics)
+            - selectRange(targetList, lowIndex, highIndex, k) rearranges the
+              range in place so targetList[k] holds the value it would have
+              if the range were sorted, smaller-or-equal values before it
+              and greater-or-equal values after it
+            - sortRange(targetList, lowIndex, highIndex) sorts the range in
+              place in O(m log m), even with many equal values
+            - readMetrics returns {'comparisons': ..., 'moves': ...}
+    """
+    swapElements, choosePivot, partitionAroundLast, partitionArray, readPartitionMetrics = makePartitioner(pivot)
+    # Comparisons made outside partitionArray (fallback path only)
+    comparisonCount = 0
+
+    def lessThan(x, y):
+        nonlocal comparisonCount
+        comparisonCount += 1
+        return x < y
+
+    def sortSmallRange(targetList, lowIndex, highIndex):
+        for i in range(lowIndex + 1, highIndex + 1):
+            j = i
+            while j > lowIndex and lessThan(targetList[j], targetList[j - 1]):
+                swapElements(targetList, j, j - 1)
+                j -= 1
+
+    def medianOfMediansIndex(targetList, lowIndex, highIndex):
+        if highIndex - lowIndex < GROUP_SIZE:
+            sortSmallRange(targetList, lowIndex, highIndex)
+            return (lowIndex + highIndex) // 2
+        # Gather each group's median at the front of the range
+        medianSlot = lowIndex
+        for groupLow in range(lowIndex, highIndex + 1, GROUP_SIZE):
+            groupHigh = min(groupLow + GROUP_SIZE - 1, highIndex)
+            sortSmallRange(targetList, groupLow, groupHigh)
+            swapElements(targetList, (groupLow + groupHigh) // 2, medianSlot)
+            medianSlot += 1
+        midIndex = lowIndex + (medianSlot - 1 - lowIndex) // 2
+        selectRange(targetList, lowIndex, medianSlot - 1, midIndex, guaranteed=True)
+        return midIndex
+
+    def threeWayPartition(targetList, lowIndex, highIndex):
+        # Lomuto leaves [low, p-1] <= pivot; a second pass splits off the
+        # values equal to the pivot so they are never partitioned again
+        partitionIndex = partitionAroundLast(targetList, lowIndex, highIndex)
+        pivotValue = targetList[partitionIndex]
+        store = lowIndex
+        for j in range(lowIndex, partitionIndex):
+            if lessThan(targetList[j], pivotValue):
+                swapElements(targetList, store, j)
+                store += 1
+        return store, partitionIndex
+
+    def selectRange(targetList, lowIndex, highIndex, k, guaranteed=False):
+        work = 0
+        workLimit = WORK_LIMIT_FACTOR * (highIndex - lowIndex + 1)
+        while lowIndex < highIndex:
+            if guaranteed or work > workLimit:
+                guaranteed = True
+                swapElements(targetList, medianOfMediansIndex(targetList, lowIndex, highIndex), highIndex)
+                equalLow, equalHigh = threeWayPartition(targetList, lowIndex, highIndex)
+                if k < equalLow:
+                    highIndex = equalLow - 1
+                elif k > equalHigh:
+                    lowIndex = equalHigh + 1
+                else:
+                    return
+            else:
+                work += highIndex - lowIndex + 1
+                partitionIndex = partitionArray(targetList, lowIndex, highIndex)
+                if k < partitionIndex:
+                    highIndex = partitionIndex - 1
+                elif k > partitionIndex:
+                    lowIndex = partitionIndex + 1
+                else:
+                    return
+
+    def sortRange(targetList, lowIndex, highIndex):
+        # Iterative three-way quicksort: values equal to the pivot are split
+        # off once, and a range whose depth budget runs out switches to
+        # median-of-medians pivots, so neither equal keys nor bad pivots can
+        # make it quadratic or recurse deeply
+        stack = [(lowIndex, highIndex, 2 * (highIndex - lowIndex + 1).bit_length())]
+        while stack:
+            lowIndex, highIndex, budget = stack.pop()
+            if highIndex - lowIndex < GROUP_SIZE:
+                sortSmallRange(targetList, lowIndex, highIndex)
+                continue
+            if budget > 0:
+                choosePivot(targetList, lowIndex, highIndex)
+            else:
+                swapElements(targetList, medianOfMediansIndex(targetList, lowIndex, highIndex), highIndex)
+            equalLow, equalHigh = threeWayPartition(targetList, lowIndex, highIndex)
+            stack.append((lowIndex, equalLow - 1, budget - 1))
+            stack.append((equalHigh + 1, highIndex, budget - 1))
+
+    def readMetrics():
+        metrics = readPartitionMetrics()
+        metrics['comparisons'] += comparisonCount
+        return metrics
+
+    return selectRange, sortRange, readMetrics
+
+
+def nth_element(a: list[int], k: int, pivot: str = "median3") -> tuple[list[int], dict]:
+    """
+    Partially orders a copy of the list around its k-th smallest element
+    (0-based), like C++ std::nth_element.
+
+    Args:
+        a (list[int]): The list of integers.
+        k (int): Index the element would have in sorted order.
+        pivot (str): Pivot strategy for the quickselect phase.
+    Returns:
+        tuple: (list, metrics) where list[k] is the k-th smallest value,
+            every element before it is <= list[k] and every element after
+            it is >= list[k].
+    """
+    if not 0 <= k < len(a):
+        raise ValueError(f"k must be in [0, {len(a)}), got {k}")
+    listToSelect = a[:]
+    selectRange, _, readMetrics = makeSelector(pivot)
+    selectRange(listToSelect, 0, len(listToSelect) - 1, k)
+    return listToSelect, readMetrics()
+
+
+def select(a: list[int], k: int, pivot: str = "median3") -> tuple[int, dict]:
+    """
+    Returns the k-th smallest element (0-based) in linear time.
+
+    Args:
+        a (list[int]): The list of integers (not modified).
+        k (int): Index the element would have in sorted order.
+        pivot (str): Pivot strategy for the quickselect phase.
+    Returns:
+        tuple: (value, metrics)
+    """
+    selected, metrics = nth_element(a, k, pivot)
+    return selected[k], metrics
+
+
+def partial_sort(a: list[int], k: int, pivot: str = "median3", largest: bool = False) -> tuple[list[int], dict]:
+    """
+    Returns a copy of the list whose first k elements are the k smallest in
+    sorted order; the order of the remaining elements is unspecified.
+
+    Args:
+        a (list[int]): The list of integers.
+        k (int): Number of elements to sort (0 <= k <= len(a)).
+        pivot (str): Pivot strategy for selection and for sorting the prefix.
+        largest (bool): Sort the k largest into the last k positions instead.
+    Returns:
+        tuple: (list, metrics)
+    """
+    if not 0 <= k <= len(a):
+        raise ValueError(f"k must be in [0, {len(a)}], got {k}")
+    if k == 0:
+        return a[:], {'comparisons': 0, 'moves': 0}
+    listToSort = a[:]
+    selectRange, sortRange, readMetrics = makeSelector(pivot)
+    if largest:
+        lowIndex, highIndex = len(a) - k, len(a) - 1
+        selectRange(listToSort, 0, len(a) - 1, lowIndex)
+    else:
+        lowIndex, highIndex = 0, k - 1
+        selectRange(listToSort, 0, len(a) - 1, highIndex)
+    sortRange(listToSort, lowIndex, highIndex)
+    return listToSort, readMetrics()
+
+
+def top_k(a: list[int], k: int, pivot: str = "median3") -> tuple[list[int], dict]:
+    """
+    Returns the k largest elements in descending order.
+
+    Args:
+        a (list[int]): The list of integers (not modified).
+        k (int): Number of elements to return (0 <= k <= len(a)).
+        pivot (str): Pivot strategy for selection and for sorting the result.
+    Returns:
+        tuple: (list of k largest values, largest first; metrics)
+    """
+    if not 0 <= k <= len(a):
+        raise ValueError(f"k must be in [0, {len(a)}], got {k}")
+    if k == 0:
+        return [], {'comparisons': 0, 'moves': 0}
+    partitioned, metrics = partial_sort(a, k, pivot, largest=True)
+    largest = partitioned[len(a) - k:]
+    largest.reverse()
+    return largest, metrics
+
+
+def stream_top_k(values, k: int) -> tuple[list[int], dict]:
+    """
+    Returns the k largest values from any iterable in descending order using
+    a bounded min-heap, so memory is O(k) no matter how long the stream is
+    (e.g. a generator reading integers from a file).
+
+    Args:
+        values (iterable[int]): The values to scan once.
+        k (int): Number of elements to keep.
+    Returns:
+        tuple: (list of k largest values, largest first; metrics)
+            - 'comparisons': Comparisons against the current k-th largest
+            - 'moves': Heap insertions
+    """
+    if k < 0:
+        raise ValueError(f"k must be non-negative, got {k}")
+    heap = []
+    comparisons = 0
+    moves = 0
+    if k == 0:
+        return [], {'comparisons': comparisons, 'moves': moves}
+    for value in values:
+        if len(heap) < k:
+            heapq.heappush(heap, value)
+            moves += 1
+        else:
+            comparisons += 1
+            if value > heap[0]:
+                heapq.heapreplace(heap, value)
+                moves += 1
+    heap.sort(reverse=True)
+    return heap, {'comparisons': comparisons, 'moves': moves}
@@ -0,0 +1,434 @@
+# Warm local sort service: keeps a process pool with the sorting modules
+# already imported and serves driver.ALGORITHMS over a Unix socket (or
+# localhost TCP), batching small requests into one pool task.
+#
+# Wire format (all integers little-endian):
+#   request:  REQUEST_HEADER (name length, element count), the name as UTF-8
+#             ("quicksort", "quicksort:first" to pick a pivot, or "stats"),
+#             then `count` int64 values
+#   response: RESPONSE_HEADER (status, element count, info length), `count`
+#             int64 values, then `info` bytes: metrics JSON on success, an
+#             error message on failure, the stats JSON for "stats"
+# A request over the element limit gets an error response and the connection
+# is closed, since its payload is never read.
+import argparse
+import asyncio
+import json
+import os
+import random
+import socket
+import struct
+import sys
+import time
+from array import array
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+from driver import ALGORITHMS, PIVOT_ALGORITHMS, PIVOT_STRATEGIES
+
+REQUEST_HEADER = struct.Struct('<HI')
+RESPONSE_HEADER = struct.Struct('<BII')
+STATUS_OK = 0
+STATUS_ERROR = 1
+
+DEFAULT_SOCKET = '/tmp/sort_service.sock'
+DEFAULT_HOST = '127.0.0.1'
+
+# Requests up to SMALL_REQUEST elements are grouped into one pool task
+SMALL_REQUEST = 2048
+BATCH_WINDOW_MS = 1.0
+BATCH_MAX_REQUESTS = 64
+BATCH_MAX_ELEMENTS = 65536
+
+# Largest request accepted (elements); bounds the memory one request can claim
+MAX_REQUEST_ELEMENTS = 1 << 24
+
+# Recent request latencies kept for percentiles
+LATENCY_WINDOW = 10000
+
+
+def pack_values(values):
+    """
+    Encode integers as little-endian int64 bytes.
+    """
+    packed = array('q', values)
+    if sys.byteorder == 'big':
+        packed.byteswap()
+    return packed.tobytes()
+
+
+def unpack_values(payload):
+    """
+    Decode little-endian int64 bytes into a list of integers.
+    """
+    values = array('q')
+    values.frombytes(payload)
+    if sys.byteorder == 'big':
+        values.byteswap()
+    return values.tolist()
+
+
+def parse_algorithm(name):
+    """
+    Split "quicksort:first" into ("quicksort", "first").
+
+    Raises:
+        ValueError: For unknown algorithms or pivot strategies, or a pivot
+            given for an algorithm that does not take one
+    """
+    algo, _, pivot = name.partition(':')
+    if algo not in ALGORITHMS:
+        raise ValueError(f"Unknown algorithm: {algo}")
+    if pivot and algo not in PIVOT_ALGORITHMS:
+        raise ValueError(f"{algo} does not take a pivot strategy")
+    if pivot and pivot not in PIVOT_STRATEGIES:
+        raise ValueError(f"Invalid pivot strategy: {pivot}")
+    return algo, pivot or None
+
+
+def sort_batch(jobs):
+    """
+    Worker entry point: sort every (name, payload) job in one pool task.
+
+    Returns:
+        List of (status, payload bytes, info bytes), one per job
+    """
+    results = []
+    for name, payload in jobs:
+        try:
+            algo, pivot = parse_algorithm(name)
+            values = unpack_values(payload)
+            if pivot is not None:
+                sorted_values, metrics = ALGORITHMS[algo](values, pivot=pivot)
+            else:
+                sorted_values, metrics = ALGORITHMS[algo](values)
+            results.append((STATUS_OK, pack_values(sorted_values), json.dumps(metrics).encode('utf-8')))
+        except Exception as e:
+            results.append((STATUS_ERROR, b'', str(e).encode('utf-8')))
+    return results
+
+
+def warm_worker():
+    """
+    Pool initializer: run every algorithm once so the first real request
+    does not pay for imports or first-call setup.
+    """
+    for name in ALGORITHMS:
+        sort_batch([(name, pack_values([3, -1, 2]))])
+
+
+def percentile(sorted_values, p):
+    """
+    Nearest-rank percentile of an already sorted list.
+    """
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, max(0, int(round(p / 100 * len(sorted_values) + 0.5)) - 1))
+    return sorted_values[index]
+
+
+class SortService:
+    """
+    asyncio front end: reads framed requests, batches small ones and runs
+    them on a warm ProcessPoolExecutor.
+    """
+
+    def __init__(self, workers=None, batch_window_ms=BATCH_WINDOW_MS, batch_max=BATCH_MAX_REQUESTS,
+                 max_elements=MAX_REQUEST_ELEMENTS):
+        self.workers = workers or os.cpu_count() or 1
+        self.batch_window = batch_window_ms / 1000
+        self.batch_max = batch_max
+        self.max_elements = max_elements
+        self.pool = None
+        self.queue = None
+        self.started = time.perf_counter()
+        self.latencies_ms = deque(maxlen=LATENCY_WINDOW)
+        self.completed = 0
+        self.elements = 0
+        self.batches = 0
+        self.batched_requests = 0
+        self.running = set()
+
+    async def start(self):
+        self.pool = ProcessPoolExecutor(max_workers=self.workers, initializer=warm_worker)
+        self.queue = asyncio.Queue()
+        loop = asyncio.get_running_loop()
+        # Force every worker process to start (and warm up) before serving
+        await asyncio.gather(*(loop.run_in_executor(self.pool, sort_batch, []) for _ in range(self.workers)))
+        self.started = time.perf_counter()
+        self.batcher = asyncio.create_task(self.batch_loop())
+
+    def close(self):
+        self.batcher.cancel()
+        self.pool.shutdown(cancel_futures=True)
+
+    async def submit(self, name, payload):
+        """
+        Queue one job and wait for its (status, payload, info) result.
+        """
+        loop = asyncio.get_running_loop()
+        if len(payload) // 8 > SMALL_REQUEST:
+            return (await loop.run_in_executor(self.pool, sort_batch, [(name, payload)]))[0]
+        future = loop.create_future()
+        await self.queue.put((name, payload, future))
+        return await future
+
+    async def batch_loop(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self.queue.get()]
+            elements = len(batch[0][1]) // 8
+            deadline = loop.time() + self.batch_window
+            while len(batch) < self.batch_max and elements < BATCH_MAX_ELEMENTS:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    job = await asyncio.wait_for(self.queue.get(), timeout)
+                except asyncio.TimeoutError:
+                    break
+                batch.append(job)
+                elements += len(job[1]) // 8
+            self.batches += 1
+            self.batched_requests += len(batch)
+            task = asyncio.create_task(self.run_batch(batch))
+            # Keep a reference until the batch finishes
+            self.running.add(task)
+            task.add_done_callback(self.running.discard)
+
+    async def run_batch(self, batch):
+        loop = asyncio.get_running_loop()
+        try:
+            results = await loop.run_in_executor(self.pool, sort_batch, [(name, payload) for name, payload, _ in batch])
+        except Exception as e:
+            results = [(STATUS_ERROR, b'', str(e).encode('utf-8'))] * len(batch)
+        for (_, _, future), result in zip(batch, results):
+            if not future.done():
+                future.set_result(result)
+
+    def stats(self):
+        """
+        Latency percentiles over the last LATENCY_WINDOW requests and
+        throughput since startup.
+        """
+        elapsed = time.perf_counter() - self.started
+        latencies = sorted(self.latencies_ms)
+        return {
+            'workers': self.workers,
+            'completed': self.completed,
+            'uptime_s': round(elapsed, 3),
+            'requests_per_s': round(self.completed / elapsed, 1) if elapsed > 0 else 0.0,
+            'elements_per_s': round(self.elements / elapsed, 1) if elapsed > 0 else 0.0,
+            'latency_ms': {
+                'p50': round(percentile(latencies, 50), 3),
+                'p95': round(percentile(latencies, 95), 3),
+                'p99': round(percentile(latencies, 99), 3),
+                'max': round(latencies[-1], 3) if latencies else 0.0,
+            },
+            'avg_batch_size': round(self.batched_requests / self.batches, 2) if self.batches else 0.0,
+        }
+
+    async def handle_connection(self, reader, writer):
+        try:
+            while True:
+                try:
+                    header = await reader.readexactly(REQUEST_HEADER.size)
+                except asyncio.IncompleteReadError:
+                    break
+                name_length, count = REQUEST_HEADER.unpack(header)
+                name = (await reader.readexactly(name_length)).decode('utf-8', errors='replace')
+                if count > self.max_elements:
+                    info = f"Request of {count} elements exceeds the limit of {self.max_elements}".encode('utf-8')
+                    writer.write(RESPONSE_HEADER.pack(STATUS_ERROR, 0, len(info)) + info)
+                    await writer.drain()
+                    break
+                payload = await reader.readexactly(count * 8)
+                received = time.perf_counter()
+
+                if name == 'stats':
+                    status, body, info = STATUS_OK, b'', json.dumps(self.stats()).encode('utf-8')
+                else:
+                    try:
+                        parse_algorithm(name)
+                    except ValueError as e:
+                        status, body, info = STATUS_ERROR, b'', str(e).encode('utf-8')
+                    else:
+                        status, body, info = await self.submit(name, payload)
+                    self.completed += 1
+                    self.elements += count
+                    self.latencies_ms.append((time.perf_counter() - received) * 1000)
+
+                writer.write(RESPONSE_HEADER.pack(status, len(body) // 8, len(info)) + body + info)
+                await writer.drain()
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+
+async def serve(args):
+    service = SortService(workers=args.workers, batch_window_ms=args.batch_window_ms, batch_max=args.batch_max,
+                          max_elements=args.max_elements)
+    await service.start()
+    if args.port is not None:
+        server = await asyncio.start_server(service.handle_connection, args.host, args.port)
+        where = f"{args.host}:{args.port}"
+    else:
+        if os.path.exists(args.socket):
+            os.remove(args.socket)
+        server = await asyncio.start_unix_server(service.handle_connection, args.socket)
+        where = args.socket
+    print(f"Sort service listening on {where} with {service.workers} warm workers")
+    print(f"Algorithms: {', '.join(ALGORITHMS)}")
+    try:
+        async with server:
+            await server.serve_forever()
+    finally:
+        service.close()
+
+
+class SortClient:
+    """
+    Blocking client for the sort service.
+    """
+
+    def __init__(self, socket_path=DEFAULT_SOCKET, host=DEFAULT_HOST, port=None):
+        if port is not None:
+            self.sock = socket.create_connection((host, port))
+            self.sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        else:
+            self.sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            self.sock.connect(socket_path)
+
+    def close(self):
+        self.sock.close()
+
+    def _receive_exactly(self, size):
+        chunks = []
+        while size:
+            chunk = self.sock.recv(size)
+            if not chunk:
+                raise ConnectionError("Sort service closed the connection")
+            chunks.append(chunk)
+            size -= len(chunk)
+        return b''.join(chunks)
+
+    def _request(self, name, values):
+        encoded = name.encode('utf-8')
+        self.sock.sendall(REQUEST_HEADER.pack(len(encoded), len(values)) + encoded + pack_values(values))
+        status, count, info_length = RESPONSE_HEADER.unpack(self._receive_exactly(RESPONSE_HEADER.size))
+        body = self._receive_exactly(count * 8)
+        info = self._receive_exactly(info_length).decode('utf-8')
+        if status != STATUS_OK:
+            raise ValueError(info)
+        return unpack_values(body), json.loads(info)
+
+    def sort(self, values, algorithm='quicksort', pivot=None):
+        """
+        Sort integers remotely.
+
+        Returns:
+            Tuple of (sorted list, metrics dict)
+        """
+        return self._request(f"{algorithm}:{pivot}" if pivot else algorithm, values)
+
+    def stats(self):
+        """
+        Server-side latency percentiles and throughput.
+        """
+        return self._request('stats', [])[1]
+
+
+async def load_worker(args, count, latencies):
+    if args.port is not None:
+        reader, writer = await asyncio.open_connection(args.host, args.port)
+    else:
+        reader, writer = await asyncio.open_unix_connection(args.socket)
+    name = args.algo.encode('utf-8')
+    rng = random.Random(args.seed + count)
+    try:
+        for _ in range(count):
+            values = [rng.randint(-10 ** 6, 10 ** 6) for _ in range(args.size)]
+            start = time.perf_counter()
+            writer.write(REQUEST_HEADER.pack(len(name), len(values)) + name + pack_values(values))
+            await writer.drain()
+            status, result_count, info_length = RESPONSE_HEADER.unpack(
+                await reader.readexactly(RESPONSE_HEADER.size))
+            await reader.readexactly(result_count * 8 + info_length)
+            latencies.append((time.perf_counter() - start) * 1000)
+            if status != STATUS_OK:
+                raise ValueError(f"Request failed with status {status}")
+    finally:
+        writer.close()
+
+
+async def load(args):
+    """
+    Load generator: `concurrency` connections send `requests` sorts of
+    `size` random integers in total, then report client-side latency
+    percentiles, throughput and the server's own statistics.
+    """
+    per_worker = [args.requests // args.concurrency] * args.concurrency
+    for i in range(args.requests % args.concurrency):
+        per_worker[i] += 1
+    latencies = []
+    start = time.perf_counter()
+    await asyncio.gather(*(load_worker(args, count, latencies) for count in per_worker if count))
+    elapsed = time.perf_counter() - start
+
+    latencies.sort()
+    print(f"Requests: {len(latencies)} x {args.size} elements ({args.algo}), concurrency {args.concurrency}")
+    print(f"Throughput: {len(latencies) / elapsed:.1f} req/s, {len(latencies) * args.size / elapsed:.0f} elements/s")
+    print(f"Latency ms: p50 {percentile(latencies, 50):.3f}, p95 {percentile(latencies, 95):.3f}, "
+          f"p99 {percentile(latencies, 99):.3f}, max {latencies[-1]:.3f}")
+
+    client = SortClient(args.socket, args.host, args.port)
+    try:
+        print(f"Server stats: {json.dumps(client.stats())}")
+    finally:
+        client.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Warm local sort service and load generator')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    def add_address(sub):
+        sub.add_argument('--socket', type=str, default=DEFAULT_SOCKET,
+                         help=f'Unix socket path (default: {DEFAULT_SOCKET})')
+        sub.add_argument('--host', type=str, default=DEFAULT_HOST, help='TCP host when --port is given')
+        sub.add_argument('--port', type=int, help='Listen/connect on localhost TCP instead of the Unix socket')
+
+    serve_parser = subparsers.add_parser('serve', help='Run the service')
+    add_address(serve_parser)
+    serve_parser.add_argument('--workers', type=int, help='Worker processes (default: CPU count)')
+    serve_parser.add_argument('--batch-window-ms', type=float, default=BATCH_WINDOW_MS,
+                              help=f'How long to gather small requests into a batch (default: {BATCH_WINDOW_MS})')
+    serve_parser.add_argument('--batch-max', type=int, default=BATCH_MAX_REQUESTS,
+                              help=f'Maximum requests per batch (default: {BATCH_MAX_REQUESTS})')
+    serve_parser.add_argument('--max-elements', type=int, default=MAX_REQUEST_ELEMENTS,
+                              help=f'Largest request accepted, in integers (default: {MAX_REQUEST_ELEMENTS})')
+
+    load_parser = subparsers.add_parser('load', help='Benchmark a running service')
+    add_address(load_parser)
+    load_parser.add_argument('--requests', type=int, default=2000, help='Total requests (default: 2000)')
+    load_parser.add_argument('--concurrency', type=int, default=16, help='Parallel connections (default: 16)')
+    load_parser.add_argument('--size', type=int, default=100, help='Integers per request (default: 100)')
+    load_parser.add_argument('--algo', type=str, default='quicksort',
+                             help='Algorithm, optionally with pivot, e.g. quicksort:first (default: quicksort)')
+    load_parser.add_argument('--seed', type=int, default=42, help='Random seed (default: 42)')
+
+    args = parser.parse_args()
+    try:
+        if args.command == 'serve':
+            asyncio.run(serve(args))
+        else:
+            if args.concurrency < 1:
+                parser.error("--concurrency must be at least 1")
+            asyncio.run(load(args))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()